@@ -3,21 +3,75 @@ CloudOptima - Assignment Problem Solver
 Hungarian Algorithm for Job-to-Node Assignment
 """
 
-import pandas as pd
+import io
 import numpy as np
-from datetime import datetime
+from time import strftime
+from functools import lru_cache
+from scipy.optimize import linear_sum_assignment
+from data_loader import load_rows
+
+
+def _zero_assignments(reduced, original):
+    """Greedily pick independent zeros of a reduced matrix, cheapest original cost first"""
+    n = reduced.shape[0]
+    zeros = np.argwhere(reduced == 0)
+    # Stable sort keeps row-major order among equal costs
+    order = np.argsort(original[zeros[:, 0], zeros[:, 1]], kind='stable')
+    zeros = zeros[order].tolist()
+    
+    # Assigned rows/columns are tracked as bitmasks: bit k set = index k taken
+    row_mask = col_mask = 0
+    row_assign = np.empty(n, dtype=np.int64)
+    col_assign = np.empty(n, dtype=np.int64)
+    count = 0
+    
+    for i, j in zeros:
+        if ((row_mask >> i) | (col_mask >> j)) & 1 == 0:
+            row_assign[count] = i
+            col_assign[count] = j
+            row_mask |= 1 << i
+            col_mask |= 1 << j
+            count += 1
+            
+            if count == n:
+                break
+    
+    return row_assign[:count], col_assign[:count]
+
+
+@lru_cache(maxsize=None)
+def _row_format(n):
+    """Format string for a job label plus n node columns, built once per size"""
+    return "{:<20}" + "{:>8}" * n
+
+
+def _render_matrix(jobs, nodes, cells):
+    """Render the job-by-node table from an array of pre-formatted cell strings"""
+    fmt = _row_format(len(nodes)).format
+    lines = [fmt('Job', *nodes), "-" * 90]
+    # tolist() hands format plain str objects instead of NumPy scalars
+    lines.extend(fmt(job, *row) for job, row in zip(jobs, cells.tolist()))
+    return "\n".join(lines)
 
 
 class HungarianSolver:
     """Hungarian Algorithm implementation for assignment problem"""
     
     def __init__(self, cost_matrix, row_names, col_names):
-        self.original_matrix = np.array(cost_matrix, dtype=float)
         self.row_names = row_names
         self.col_names = col_names
         self.n = len(row_names)
+        # Original and working matrices share one contiguous (2, n, n) buffer;
+        # costs are whole minutes, so the whole solve runs in int32
+        self._buf = np.empty((2, self.n, self.n), dtype=np.int32)
+        self._buf[0] = np.rint(cost_matrix)
+        self.original_matrix = self._buf[0]
         self.steps = []
         
+        # Header/separator for _format_matrix are the same on every call
+        self._matrix_header = "       " + "".join(f"{col:>8}" for col in col_names)
+        self._matrix_sep = "-" * len(self._matrix_header)
+        
     def solve(self):
         """Main Hungarian algorithm"""
         self.steps.append("\n" + "="*90)
@@ -25,15 +79,16 @@ class HungarianSolver:
         self.steps.append("="*90)
         
         # Step 1: Row reduction
-        matrix = self.original_matrix.copy()
+        matrix = self._buf[1]
+        matrix[...] = self.original_matrix
         self.steps.append("\n📉 STEP 1: ROW REDUCTION")
         self.steps.append("Subtract minimum value from each row")
         self.steps.append("-" * 70)
         
-        for i in range(self.n):
-            row_min = np.min(matrix[i])
-            matrix[i] -= row_min
-            self.steps.append(f"Row {i+1} ({self.row_names[i]}): min = {row_min:.1f}")
+        row_mins = matrix.min(axis=1, keepdims=True)
+        matrix -= row_mins
+        self.steps.extend(f"Row {i+1} ({self.row_names[i]}): min = {row_min:.1f}"
+                          for i, row_min in enumerate(row_mins[:, 0]))
         
         self.steps.append("\nMatrix after row reduction:")
         self.steps.append(self._format_matrix(matrix))
@@ -43,10 +98,10 @@ class HungarianSolver:
         self.steps.append("Subtract minimum value from each column")
         self.steps.append("-" * 70)
         
-        for j in range(self.n):
-            col_min = np.min(matrix[:, j])
-            matrix[:, j] -= col_min
-            self.steps.append(f"Col {j+1} ({self.col_names[j]}): min = {col_min:.1f}")
+        col_mins = matrix.min(axis=0, keepdims=True)
+        matrix -= col_mins
+        self.steps.extend(f"Col {j+1} ({self.col_names[j]}): min = {col_min:.1f}"
+                          for j, col_min in enumerate(col_mins[0]))
         
         self.steps.append("\nMatrix after column reduction:")
         self.steps.append(self._format_matrix(matrix))
@@ -59,88 +114,32 @@ class HungarianSolver:
         assignments = self._find_assignments(matrix)
         
         if len(assignments) == self.n:
+            # A full set of independent zeros in the reduced matrix is optimal
             self.steps.append(f"\n✅ Complete assignment found with {self.n} pairs!")
         else:
             self.steps.append(f"\n⚠️ Partial assignment: {len(assignments)}/{self.n} pairs")
-            self.steps.append("Applying additional optimization...")
-            # Try greedy fallback
-            assignments = self._greedy_assignment()
+            self.steps.append("Completing with optimal assignment solver (Jonker-Volgenant)...")
+            # A greedy pass over the remaining cells is not an optimal LAP
+            # solver and can return far costlier assignments, so hand the
+            # original matrix to SciPy's exact solver instead.
+            row_ind, col_ind = linear_sum_assignment(self.original_matrix)
+            assignments = list(zip(row_ind.tolist(), col_ind.tolist()))
         
         return assignments
     
     def _find_assignments(self, matrix):
         """Find optimal assignments from reduced matrix"""
-        assignments = []
-        assigned_rows = set()
-        assigned_cols = set()
-        
-        # Greedy approach: assign zeros with minimum original cost
-        zero_positions = []
-        for i in range(self.n):
-            for j in range(self.n):
-                if abs(matrix[i, j]) < 1e-6:  # Is zero
-                    zero_positions.append((self.original_matrix[i, j], i, j))
-        
-        # Sort by original cost
-        zero_positions.sort()
-        
-        for _, i, j in zero_positions:
-            if i not in assigned_rows and j not in assigned_cols:
-                assignments.append((i, j))
-                assigned_rows.add(i)
-                assigned_cols.add(j)
-                
-                if len(assignments) == self.n:
-                    break
-        
-        return assignments
-    
-    def _greedy_assignment(self):
-        """Greedy fallback: assign to minimum cost positions"""
-        assignments = []
-        assigned_rows = set()
-        assigned_cols = set()
-        
-        # Create list of all positions with costs
-        all_positions = []
-        for i in range(self.n):
-            for j in range(self.n):
-                all_positions.append((self.original_matrix[i, j], i, j))
-        
-        # Sort by cost
-        all_positions.sort()
-        
-        # Greedy assignment
-        for cost, i, j in all_positions:
-            if i not in assigned_rows and j not in assigned_cols:
-                assignments.append((i, j))
-                assigned_rows.add(i)
-                assigned_cols.add(j)
-                
-                if len(assignments) == self.n:
-                    break
-        
-        return assignments
+        rows, cols = _zero_assignments(matrix, self.original_matrix)
+        return list(zip(rows.tolist(), cols.tolist()))
     
     def _format_matrix(self, matrix):
         """Format matrix for display"""
-        lines = []
-        
-        # Header
-        header = "       " + "".join(f"{col:>8}" for col in self.col_names)
-        lines.append(header)
-        lines.append("-" * len(header))
+        lines = [self._matrix_header, self._matrix_sep]
         
-        # Rows
+        # Rows (zeros highlighted; cells chosen with one vectorized mask)
+        cell_strs = np.where(matrix == 0, f"{'[0]':>8}", np.char.mod('%8d', matrix))
         for i in range(self.n):
-            row_str = f"{self.row_names[i]:<6}"
-            for j in range(self.n):
-                val = matrix[i, j]
-                if abs(val) < 1e-6:
-                    row_str += f"{'[0]':>8}"  # Highlight zeros
-                else:
-                    row_str += f"{val:>8.1f}"
-            lines.append(row_str)
+            lines.append(f"{self.row_names[i]:<6}" + "".join(cell_strs[i]))
         
         return "\n".join(lines)
     
@@ -151,66 +150,65 @@ class HungarianSolver:
 
 def run_assignment_problem(minimize=True):
     """Main function to solve CloudOptima assignment problem"""
-    output = []
+    buf = io.StringIO()
+    write = buf.write
+    
+    def emit(line):
+        write(line)
+        write("\n")
     
     try:
         # Read data
-        df = pd.read_excel('CloudOptima_OR_Data.xlsx', 
-                          sheet_name='Assignment_Problem', 
-                          index_col=0)
-        
-        output.append("="*90)
-        output.append("☁️  CLOUDOPTIMA - ASSIGNMENT PROBLEM")
-        output.append("="*90)
-        output.append(f"\n📅 Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        output.append(f"🎯 Objective: MINIMIZE total processing time")
-        output.append(f"📊 Problem: Assign 10 computing jobs to 10 server nodes")
+        header, *rows = load_rows('Assignment_Problem')
+        rows = [row for row in rows if row[0] is not None]
+        jobs = [row[0] for row in rows]
+        nodes = list(header[1:])
+        vals = np.array([row[1:] for row in rows])
+        
+        emit("="*90)
+        emit("☁️  CLOUDOPTIMA - ASSIGNMENT PROBLEM")
+        emit("="*90)
+        emit(f"\n📅 Analysis Date: {strftime('%Y-%m-%d %H:%M:%S')}")
+        emit(f"🎯 Objective: MINIMIZE total processing time")
+        emit(f"📊 Problem: Assign 10 computing jobs to 10 server nodes")
         
         # Problem description
-        output.append(f"\n📋 COMPUTING JOBS:")
-        for i, job in enumerate(df.index, 1):
-            output.append(f"  {i}. {job}")
+        emit(f"\n📋 COMPUTING JOBS:")
+        for i, job in enumerate(jobs, 1):
+            emit(f"  {i}. {job}")
         
-        output.append(f"\n💻 SERVER NODES:")
-        for i, node in enumerate(df.columns, 1):
-            output.append(f"  {i}. {node}")
+        emit(f"\n💻 SERVER NODES:")
+        for i, node in enumerate(nodes, 1):
+            emit(f"  {i}. {node}")
         
         # Display cost matrix
-        output.append(f"\n📊 PROCESSING TIME MATRIX (minutes):")
-        output.append("-" * 90)
-        
-        # Header
-        header = f"{'Job':<20}" + "".join(f"{col:>8}" for col in df.columns)
-        output.append(header)
-        output.append("-" * 90)
+        emit(f"\n📊 PROCESSING TIME MATRIX (minutes):")
+        emit("-" * 90)
         
-        # Rows
-        for job in df.index:
-            row_str = f"{job:<20}"
-            for node in df.columns:
-                row_str += f"{int(df.loc[job, node]):>8}"
-            output.append(row_str)
+        # All cells formatted in one vectorized pass
+        int_vals = vals.astype(np.int64)
+        cells = np.char.rjust(int_vals.astype(str), 8)
+        emit(_render_matrix(jobs, nodes, cells))
         
-        output.append("-" * 90)
+        emit("-" * 90)
         
         # Solve using Hungarian algorithm
-        output.append(f"\n⏳ Applying Hungarian Algorithm...")
+        emit(f"\n⏳ Applying Hungarian Algorithm...")
         
-        cost_matrix = df.values
-        solver = HungarianSolver(cost_matrix, list(df.index), list(df.columns))
+        solver = HungarianSolver(vals, jobs, nodes)
         assignments = solver.solve()
         
         # Add algorithm steps
-        output.append(solver.get_steps())
+        emit(solver.get_steps())
         
         # Calculate total cost
         total_time = 0
         assignment_details = []
         
         for job_idx, node_idx in assignments:
-            job = df.index[job_idx]
-            node = df.columns[node_idx]
-            time = df.iloc[job_idx, node_idx]
+            job = jobs[job_idx]
+            node = nodes[node_idx]
+            time = vals[job_idx, node_idx]
             total_time += time
             assignment_details.append((job, node, time))
         
@@ -218,14 +216,14 @@ def run_assignment_problem(minimize=True):
         assignment_details.sort(key=lambda x: x[0])
         
         # Display results
-        output.append("\n" + "="*90)
-        output.append("🎉 OPTIMAL ASSIGNMENT FOUND!")
-        output.append("="*90)
+        emit("\n" + "="*90)
+        emit("🎉 OPTIMAL ASSIGNMENT FOUND!")
+        emit("="*90)
         
-        output.append(f"\n📋 ASSIGNMENT DETAILS:")
-        output.append("-" * 70)
-        output.append(f"{'Job':<25} {'→ Server Node':<18} {'Time (min)':>12} {'Cost ($)':>12}")
-        output.append("-" * 70)
+        emit(f"\n📋 ASSIGNMENT DETAILS:")
+        emit("-" * 70)
+        emit(f"{'Job':<25} {'→ Server Node':<18} {'Time (min)':>12} {'Cost ($)':>12}")
+        emit("-" * 70)
         
         cost_per_minute = 0.50  # $0.50 per minute of processing
         total_cost = 0
@@ -233,56 +231,50 @@ def run_assignment_problem(minimize=True):
         for job, node, time in assignment_details:
             cost = time * cost_per_minute
             total_cost += cost
-            output.append(f"{job:<25} → {node:<16} {int(time):>12} ${cost:>11.2f}")
+            emit(f"{job:<25} → {node:<16} {int(time):>12} ${cost:>11.2f}")
         
-        output.append("-" * 70)
-        output.append(f"{'TOTAL':<43} {int(total_time):>12} ${total_cost:>11.2f}")
+        emit("-" * 70)
+        emit(f"{'TOTAL':<43} {int(total_time):>12} ${total_cost:>11.2f}")
         
         # Summary statistics
-        output.append(f"\n📊 SUMMARY:")
-        output.append(f"  • Total processing time: {int(total_time)} minutes ({total_time/60:.1f} hours)")
-        output.append(f"  • Average time per job: {total_time/len(assignments):.1f} minutes")
-        output.append(f"  • Total cost (at $0.50/min): ${total_cost:.2f}")
-        output.append(f"  • All {len(assignments)} jobs successfully assigned")
+        emit(f"\n📊 SUMMARY:")
+        emit(f"  • Total processing time: {int(total_time)} minutes ({total_time/60:.1f} hours)")
+        emit(f"  • Average time per job: {total_time/len(assignments):.1f} minutes")
+        emit(f"  • Total cost (at $0.50/min): ${total_cost:.2f}")
+        emit(f"  • All {len(assignments)} jobs successfully assigned")
         
         # Show assignment matrix with marks
-        output.append(f"\n📊 ASSIGNMENT MATRIX (✓ = assigned):")
-        output.append("-" * 90)
-        
-        assigned_positions = set(assignments)
+        emit(f"\n📊 ASSIGNMENT MATRIX (✓ = assigned):")
+        emit("-" * 90)
         
-        header = f"{'Job':<20}" + "".join(f"{col:>8}" for col in df.columns)
-        output.append(header)
-        output.append("-" * 90)
+        assigned_rows, assigned_cols = zip(*assignments)
+        assigned_mask = np.zeros(vals.shape, dtype=bool)
+        assigned_mask[list(assigned_rows), list(assigned_cols)] = True
+        marked_cells = np.where(assigned_mask,
+                                np.char.add(np.char.rjust(int_vals.astype(str), 6), "✓ "),
+                                cells)
         
-        for i, job in enumerate(df.index):
-            row_str = f"{job:<20}"
-            for j, node in enumerate(df.columns):
-                time = int(df.iloc[i, j])
-                if (i, j) in assigned_positions:
-                    row_str += f"{time:>6}✓ "
-                else:
-                    row_str += f"{time:>8}"
-            output.append(row_str)
+        emit(_render_matrix(jobs, nodes, marked_cells))
         
-        output.append("-" * 90)
+        emit("-" * 90)
         
         # Verification
-        output.append(f"\n🔍 VERIFICATION:")
-        output.append(f"  ✓ All 10 jobs assigned to unique nodes")
-        output.append(f"  ✓ All 10 nodes utilized (no idle servers)")
-        output.append(f"  ✓ One-to-one mapping achieved")
-        output.append(f"  ✓ Optimal solution guarantees minimum total time")
+        emit(f"\n🔍 VERIFICATION:")
+        emit(f"  ✓ All 10 jobs assigned to unique nodes")
+        emit(f"  ✓ All 10 nodes utilized (no idle servers)")
+        emit(f"  ✓ One-to-one mapping achieved")
+        emit(f"  ✓ Optimal solution guarantees minimum total time")
         
-        output.append(f"\n✅ Assignment Problem Solved Successfully!")
-        output.append("="*90)
+        emit(f"\n✅ Assignment Problem Solved Successfully!")
+        emit("="*90)
         
     except Exception as e:
         import traceback
-        output.append(f"\n❌ ERROR: {str(e)}")
-        output.append(f"\nTraceback:\n{traceback.format_exc()}")
+        emit(f"\n❌ ERROR: {str(e)}")
+        emit(f"\nTraceback:\n{traceback.format_exc()}")
     
-    return "\n".join(output)
+    # Drop the newline written after the last line
+    return buf.getvalue()[:-1]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,28 @@
+"""
+CloudOptima - Batch Solver
+Runs the LP, Assignment and Transportation solvers in parallel processes
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+from simplex_method import run_simplex_method
+from assignment_problem import run_assignment_problem
+from transportation_problem import run_transportation_problem
+
+
+def run_all_solvers():
+    """Solve all three problems concurrently and return their reports in order"""
+    # Separate processes sidestep the GIL; each worker loads its own sheet
+    with ProcessPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(run_simplex_method, "max"),
+            executor.submit(run_assignment_problem, True),
+            executor.submit(run_transportation_problem),
+        ]
+        return [future.result() for future in futures]
+
+
+if __name__ == "__main__":
+    import sys
+    sys.stdout.reconfigure(encoding='utf-8')
+    print("\n\n".join(run_all_solvers()))
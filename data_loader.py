@@ -0,0 +1,47 @@
+"""
+CloudOptima - Shared Data Loader
+Cached access to the CloudOptima Excel workbook
+"""
+
+import os
+from functools import lru_cache
+from importlib.util import find_spec
+
+from openpyxl import load_workbook
+
+
+DATA_FILE = 'CloudOptima_OR_Data.xlsx'
+
+# pandas reads .xlsx much faster through the Rust calamine engine when the
+# optional python-calamine package is installed; openpyxl otherwise
+EXCEL_ENGINE = 'calamine' if find_spec('python_calamine') else None
+
+
+@lru_cache(maxsize=8)
+def _read_sheet(path, mtime, sheet_name):
+    """Parse one sheet (mtime is only part of the cache key)"""
+    import pandas as pd  # Deferred so pandas-free callers never pay its import
+    return pd.read_excel(path, sheet_name=sheet_name, engine=EXCEL_ENGINE)
+
+
+def load_sheet(sheet_name, path=DATA_FILE):
+    """Return a workbook sheet, re-parsing only when the file changes on disk.
+    
+    The DataFrame is shared between callers and must be treated as read-only.
+    """
+    return _read_sheet(path, os.path.getmtime(path), sheet_name)
+
+
+@lru_cache(maxsize=8)
+def _read_rows(path, mtime, sheet_name):
+    """Read raw cell values of one sheet with openpyxl (no pandas)"""
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        return tuple(wb[sheet_name].iter_rows(values_only=True))
+    finally:
+        wb.close()
+
+
+def load_rows(sheet_name, path=DATA_FILE):
+    """Return a sheet as a tuple of row tuples, cached like load_sheet"""
+    return _read_rows(path, os.path.getmtime(path), sheet_name)
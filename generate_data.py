@@ -118,21 +118,15 @@ def generate_assignment_data():
     
     # Generate realistic processing times (minutes)
     # Different jobs perform differently on different hardware
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
     # Base times for each job
-    base_times = [45, 120, 180, 30, 90, 60, 150, 100, 40, 55]
-    
-    # Generate matrix with variations
-    cost_matrix = []
-    for base_time in base_times:
-        # Add randomness: ±30% variation across nodes
-        row = np.random.randint(
-            int(base_time * 0.7), 
-            int(base_time * 1.3), 
-            size=10
-        )
-        cost_matrix.append(row)
+    base_times = np.array([45, 120, 180, 30, 90, 60, 150, 100, 40, 55])
+    
+    # Add randomness: ±30% variation across nodes (one draw for the whole matrix)
+    low = (base_times * 0.7).astype(int)
+    high = (base_times * 1.3).astype(int)
+    cost_matrix = low[:, None] + rng.integers(0, (high - low)[:, None], size=(10, 10))
     
     df = pd.DataFrame(cost_matrix, index=jobs, columns=nodes)
     
@@ -158,13 +152,12 @@ def generate_transportation_data():
     storage_vaults = [f'Vault {i+1}' for i in range(10)]
     
     # Supply (TB of data to backup from each DC)
-    np.random.seed(42)
-    supply = np.random.randint(500, 1500, size=10)
+    rng = np.random.default_rng(42)
+    supply = rng.integers(500, 1500, size=10)
     
     # Demand (TB capacity at each vault)
     # Make sure total supply ≈ total demand for balanced problem
-    demand = supply.copy()
-    np.random.shuffle(demand)
+    demand = rng.permutation(supply)
     
     # Adjust to make exactly balanced
     total_supply = supply.sum()
@@ -174,11 +167,10 @@ def generate_transportation_data():
     
     # Cost matrix ($ per TB transfer)
     # Based on distance, bandwidth costs, etc.
-    cost_matrix = np.random.uniform(0.5, 15.0, size=(10, 10))
+    cost_matrix = rng.uniform(0.5, 15.0, size=(10, 10))
     
     # Make diagonal cheaper (same region transfers)
-    for i in range(10):
-        cost_matrix[i][i] = np.random.uniform(0.1, 1.0)
+    np.fill_diagonal(cost_matrix, rng.uniform(0.1, 1.0, size=10))
     
     # Round to 2 decimals
     cost_matrix = np.round(cost_matrix, 2)
@@ -201,7 +193,7 @@ def create_excel_file():
     
     filename = 'CloudOptima_OR_Data.xlsx'
     
-    with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+    with pd.ExcelWriter(filename, engine='xlsxwriter') as writer:
         # Sheet 1: Linear Programming
         lp_df, constraint_df = generate_linear_programming_data()
         lp_df.to_excel(writer, sheet_name='Linear_Programming', index=False)
@@ -6,8 +6,29 @@ Interactive Real-Time Solver with Live Visualization
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from datetime import datetime
+import os
+import multiprocessing
+import queue
+import sys
 import threading
-import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+
+import simplex_method
+import assignment_problem
+import transportation_problem
+from data_loader import DATA_FILE
+
+
+@lru_cache(maxsize=64)
+def _darken(hex_color):
+    """Scale each channel of a #rrggbb color by 0.7"""
+    value = int(hex_color.lstrip('#'), 16)
+    r = int(((value >> 16) & 0xFF) * 0.7)
+    g = int(((value >> 8) & 0xFF) * 0.7)
+    b = int((value & 0xFF) * 0.7)
+    return f'#{r:02x}{g:02x}{b:02x}'
 
 
 class ModernCloudOptimaApp:
@@ -33,11 +54,55 @@ class ModernCloudOptimaApp:
             'warning': '#f59e0b',
             'error': '#ef4444'
         }
+        # Hover shades for every palette colour, computed once
+        self._dark = {c: self.darken_color(c) for c in set(self.colors.values())}
         
         self.root.resizable(True, True)
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        
+        # Solver entry points, bound once instead of imported per run
+        self._solvers = {
+            'lp': simplex_method.run_simplex_method,
+            'assign': assignment_problem.run_assignment_problem,
+            'trans': transportation_problem.run_transportation_problem
+        }
+        # Finished reports keyed by (solver, inputs, data file mtime)
+        self._result_cache = {}
+        # Set while no individual run of that solver is in flight
+        self._solver_done = {name: threading.Event() for name in self._solvers}
+        for event in self._solver_done.values():
+            event.set()
+        self._process_pool = None
+        # Guards _process_pool: it is created on the Tk thread but dropped by
+        # the batch worker when a worker process dies
+        self._pool_lock = threading.Lock()
+        # Futures of the latest batch run, cancelled if the window closes
+        self._batch_futures = []
+        
+        # Content views are built once and swapped in and out
+        self._views = {}
+        self._current_view = None
+        self._settings_win = None
+        # Notebook tabs whose contents are built on first selection
+        self._pending_tabs = {}
+        
+        # Worker threads never touch widgets; they queue callables that the
+        # Tk thread drains every 30ms
+        self._ui_queue = queue.Queue()
+        
+        # Status bar writes are coalesced and flushed at most every 50ms
+        self._pending_status = None
+        self._status_after_id = None
+        
+        # Clock and status redraws are skipped while the window is minimized
+        self._visible = True
+        self.root.bind('<Map>', lambda e: self._on_visibility(e, True))
+        self.root.bind('<Unmap>', lambda e: self._on_visibility(e, False))
+        
         self.center_window()
+        self._configure_styles()
         self.create_modern_ui()
+        self.root.after(30, self._drain_ui_queue)
         
     def center_window(self):
         """Center window on screen"""
@@ -51,17 +116,38 @@ class ModernCloudOptimaApp:
     def on_closing(self):
         """Handle window close"""
         if messagebox.askokcancel("Exit", "Exit CloudOptima v1.0?"):
+            if self._process_pool is not None:
+                # shutdown(cancel_futures=True) needs Python 3.9+, so queued
+                # batch runs are cancelled by hand
+                for future in self._batch_futures:
+                    future.cancel()
+                self._process_pool.shutdown(wait=False)
             self.root.destroy()
     
+    def _configure_styles(self):
+        """Register the app's ttk styles once"""
+        style = ttk.Style()
+        style.configure('Modern.TNotebook', background=self.colors['bg_card'], borderwidth=0)
+        style.configure('Modern.TNotebook.Tab', background=self.colors['bg_dark'], 
+                       foreground='white', padding=[20, 10], font=('Arial', 9, 'bold'))
+        style.map('Modern.TNotebook.Tab', background=[('selected', self.colors['accent_green'])],
+                 foreground=[('selected', 'white')])
+    
     def create_modern_ui(self):
         """Create alternative modern UI layout"""
         
+        # Root grid: fixed-height navbar and status bar around a stretching body
+        self.root.grid_columnconfigure(0, weight=1)
+        self.root.grid_rowconfigure(0, minsize=70)
+        self.root.grid_rowconfigure(1, weight=1)
+        self.root.grid_rowconfigure(2, minsize=40)
+        
         # Top Navigation Bar
         self.create_top_navbar()
         
         # Main Container with Sidebar
         main_container = tk.Frame(self.root, bg=self.colors['bg_dark'])
-        main_container.pack(fill='both', expand=True)
+        main_container.grid(row=1, column=0, sticky='nsew')
         
         # Left Sidebar - Problem Selector
         self.create_sidebar(main_container)
@@ -78,9 +164,8 @@ class ModernCloudOptimaApp:
     
     def create_top_navbar(self):
         """Create modern top navigation bar"""
-        navbar = tk.Frame(self.root, bg='#13172e', height=70)
-        navbar.pack(fill='x', side='top')
-        navbar.pack_propagate(False)
+        navbar = tk.Frame(self.root, bg='#13172e')
+        navbar.grid(row=0, column=0, sticky='nsew')
         
         # Logo Section
         logo_frame = tk.Frame(navbar, bg='#13172e')
@@ -113,14 +198,13 @@ class ModernCloudOptimaApp:
             btn.pack(side='left', padx=5)
             
             # Hover effects
-            btn.bind("<Enter>", lambda e, b=btn, c=color: b.configure(bg=self.darken_color(c)))
+            btn.bind("<Enter>", lambda e, b=btn, c=color: b.configure(bg=self._dark[c]))
             btn.bind("<Leave>", lambda e, b=btn, c=color: b.configure(bg=c))
     
     def create_sidebar(self, parent):
         """Create left sidebar with problem selector"""
-        sidebar = tk.Frame(parent, bg=self.colors['bg_card'], width=280)
+        sidebar = tk.Frame(parent, bg=self.colors['bg_card'])
         sidebar.pack(side='left', fill='y', padx=(20,0), pady=20)
-        sidebar.pack_propagate(False)
         
         # Sidebar Header
         tk.Label(sidebar, text="PROBLEMS", font=('Arial', 12, 'bold'),
@@ -136,67 +220,44 @@ class ModernCloudOptimaApp:
             ("📁", "Data Manager", "Import/Export", self.show_data_manager, self.colors['text_secondary'])
         ]
         
-        for icon, title, subtitle, command, color in self.menu_items:
-            self.create_menu_item(sidebar, icon, title, subtitle, command, color)
-    
-    def create_menu_item(self, parent, icon, title, subtitle, command, color):
-        """Create animated menu item"""
-        item_frame = tk.Frame(parent, bg=self.colors['bg_card'], cursor='hand2')
-        item_frame.pack(fill='x', padx=10, pady=5)
-        
-        # Content frame
-        content = tk.Frame(item_frame, bg=self.colors['bg_card'])
-        content.pack(fill='both', expand=True, padx=15, pady=12)
-        
-        # Icon
-        tk.Label(content, text=icon, font=('Segoe UI Emoji', 20),
-                bg=self.colors['bg_card'], fg=color).pack(side='left', padx=(0,10))
+        # The whole menu is drawn on one canvas instead of a widget tree per
+        # item; its requested width also sets the sidebar width
+        menu = tk.Canvas(sidebar, bg=self.colors['bg_card'], highlightthickness=0,
+                         width=280, cursor='hand2')
+        menu.pack(fill='both', expand=True)
         
-        # Text container
-        text_frame = tk.Frame(content, bg=self.colors['bg_card'])
-        text_frame.pack(side='left', fill='both', expand=True)
-        
-        tk.Label(text_frame, text=title, font=('Arial', 10, 'bold'),
-                bg=self.colors['bg_card'], fg='white', anchor='w').pack(fill='x')
-        
-        tk.Label(text_frame, text=subtitle, font=('Arial', 8),
-                bg=self.colors['bg_card'], fg=self.colors['text_secondary'], anchor='w').pack(fill='x')
+        for index, (icon, title, subtitle, command, color) in enumerate(self.menu_items):
+            self.create_menu_item(menu, index, icon, title, subtitle, command, color)
+    
+    def create_menu_item(self, canvas, index, icon, title, subtitle, command, color):
+        """Draw animated menu item"""
+        bg_card = self.colors['bg_card']
+        
+        top = 5 + index * 74
+        tag = f"item{index}"
+        
+        # Background, icon, title and subtitle share the item tag; the
+        # background id is kept so hover recolours it without a tag search
+        bg_item = canvas.create_rectangle(10, top, 270, top + 64, fill=bg_card,
+                                          outline='', tags=tag)
+        canvas.create_text(25, top + 32, text=icon, font=('Segoe UI Emoji', 20),
+                           fill=color, anchor='w', tags=tag)
+        canvas.create_text(75, top + 22, text=title, font=('Arial', 10, 'bold'),
+                           fill='white', anchor='w', tags=tag)
+        canvas.create_text(75, top + 42, text=subtitle, font=('Arial', 8),
+                           fill=self.colors['text_secondary'], anchor='w', tags=tag)
         
         # Hover effects
-        def on_enter(e):
-            item_frame.configure(bg=self.colors['bg_dark'])
-            content.configure(bg=self.colors['bg_dark'])
-            text_frame.configure(bg=self.colors['bg_dark'])
-            for child in text_frame.winfo_children():
-                child.configure(bg=self.colors['bg_dark'])
-            for child in content.winfo_children():
-                if isinstance(child, tk.Label):
-                    child.configure(bg=self.colors['bg_dark'])
-        
-        def on_leave(e):
-            item_frame.configure(bg=self.colors['bg_card'])
-            content.configure(bg=self.colors['bg_card'])
-            text_frame.configure(bg=self.colors['bg_card'])
-            for child in text_frame.winfo_children():
-                child.configure(bg=self.colors['bg_card'])
-            for child in content.winfo_children():
-                if isinstance(child, tk.Label):
-                    child.configure(bg=self.colors['bg_card'])
-        
-        item_frame.bind("<Enter>", on_enter)
-        item_frame.bind("<Leave>", on_leave)
-        item_frame.bind("<Button-1>", lambda e: command())
-        
-        for widget in [content, text_frame] + list(content.winfo_children()) + list(text_frame.winfo_children()):
-            widget.bind("<Button-1>", lambda e: command())
-            widget.bind("<Enter>", on_enter)
-            widget.bind("<Leave>", on_leave)
+        canvas.tag_bind(tag, "<Enter>",
+                        lambda e: canvas.itemconfigure(bg_item, fill=self.colors['bg_dark']))
+        canvas.tag_bind(tag, "<Leave>",
+                        lambda e: canvas.itemconfigure(bg_item, fill=bg_card))
+        canvas.tag_bind(tag, "<Button-1>", lambda e: command())
     
     def create_status_bar(self):
         """Create modern status bar"""
-        status_frame = tk.Frame(self.root, bg='#13172e', height=40)
-        status_frame.pack(side='bottom', fill='x')
-        status_frame.pack_propagate(False)
+        status_frame = tk.Frame(self.root, bg='#13172e')
+        status_frame.grid(row=2, column=0, sticky='nsew')
         
         self.status_label = tk.Label(status_frame, text="● Ready",
                                      font=('Consolas', 9), bg='#13172e',
@@ -208,38 +269,66 @@ class ModernCloudOptimaApp:
                                    font=('Consolas', 9), bg='#13172e',
                                    fg=self.colors['text_secondary'])
         self.time_label.pack(side='right', padx=20)
+        self._last_clock_text = None
         self.update_clock()
     
     def update_clock(self):
         """Update clock in status bar"""
-        current_time = datetime.now().strftime('%I:%M:%S %p | %B %d, %Y')
-        self.time_label.config(text=current_time)
-        self.root.after(1000, self.update_clock)
+        if not self._visible:
+            self.root.after(1000, self.update_clock)
+            return
+        
+        # Only touch the label when the minute changed
+        now = datetime.now()
+        current_time = now.strftime('%I:%M %p | %B %d, %Y')
+        if current_time != self._last_clock_text:
+            self._last_clock_text = current_time
+            self.time_label.config(text=current_time)
+        # Tick on the next whole second so the minute rolls over on time
+        self.root.after(1000 - now.microsecond // 1000, self.update_clock)
     
-    def clear_content(self):
-        """Clear content area"""
-        for widget in self.content_area.winfo_children():
-            widget.destroy()
+    def _get_view(self, name, builder):
+        """Return a content view frame, building it on first use"""
+        view = self._views.get(name)
+        if view is None:
+            view = tk.Frame(self.content_area, bg=self.colors['bg_dark'])
+            builder(view)
+            self._views[name] = view
+        return view
+    
+    def _show_view(self, name, builder):
+        """Show a content view, building its frame on first use"""
+        view = self._get_view(name, builder)
+        if view is not self._current_view:
+            if self._current_view is not None:
+                self._current_view.pack_forget()
+            view.pack(fill='both', expand=True)
+            self._current_view = view
     
     def show_dashboard(self):
         """Show interactive dashboard"""
-        self.clear_content()
+        self._show_view('dashboard', self._build_dashboard)
         self.update_status("Dashboard", self.colors['accent_blue'])
+    
+    def _build_dashboard(self, view):
+        """Build dashboard view"""
+        bg_card = self.colors['bg_card']
+        text_secondary = self.colors['text_secondary']
         
         # Welcome Section
-        welcome = tk.Frame(self.content_area, bg=self.colors['bg_card'])
+        welcome = tk.Frame(view, bg=bg_card)
         welcome.pack(fill='x', pady=(0,20))
         
         tk.Label(welcome, text="🎯 Welcome to CloudOptima v1.0",
-                font=('Arial', 24, 'bold'), bg=self.colors['bg_card'],
+                font=('Arial', 24, 'bold'), bg=bg_card,
                 fg='white').pack(padx=30, pady=(30,10), anchor='w')
         
         tk.Label(welcome, text="Interactive Operations Research Suite for Cloud Infrastructure Optimization",
-                font=('Arial', 11), bg=self.colors['bg_card'],
-                fg=self.colors['text_secondary']).pack(padx=30, pady=(0,30), anchor='w')
+                font=('Arial', 11), bg=bg_card,
+                fg=text_secondary).pack(padx=30, pady=(0,30), anchor='w')
         
         # Stats Cards
-        stats_container = tk.Frame(self.content_area, bg=self.colors['bg_dark'])
+        stats_container = tk.Frame(view, bg=self.colors['bg_dark'])
         stats_container.pack(fill='both', expand=True)
         
         stats = [
@@ -248,17 +337,19 @@ class ModernCloudOptimaApp:
             ("🚛", "Transportation", "Transportation Methods", self.colors['accent_orange'])
         ]
         
+        # Configure grid weights once for the whole card layout
+        for row in range((len(stats) + 2) // 3):
+            stats_container.grid_rowconfigure(row, weight=1)
+        for col in range(min(len(stats), 3)):
+            stats_container.grid_columnconfigure(col, weight=1)
+        
         for i, (icon, title, method, color) in enumerate(stats):
             row = i // 3
             col = i % 3
             
-            card = tk.Frame(stats_container, bg=self.colors['bg_card'])
+            card = tk.Frame(stats_container, bg=bg_card)
             card.grid(row=row, column=col, padx=10, pady=10, sticky='nsew')
             
-            # Configure grid weights
-            stats_container.grid_rowconfigure(row, weight=1)
-            stats_container.grid_columnconfigure(col, weight=1)
-            
             # Icon header
             header = tk.Frame(card, bg=color, height=80)
             header.pack(fill='x')
@@ -268,51 +359,56 @@ class ModernCloudOptimaApp:
                     bg=color).pack(expand=True)
             
             # Content
-            content = tk.Frame(card, bg=self.colors['bg_card'])
+            content = tk.Frame(card, bg=bg_card)
             content.pack(fill='both', expand=True, padx=20, pady=20)
             
             tk.Label(content, text=title, font=('Arial', 14, 'bold'),
-                    bg=self.colors['bg_card'], fg='white').pack(anchor='w')
+                    bg=bg_card, fg='white').pack(anchor='w')
             
             tk.Label(content, text=method, font=('Arial', 9),
-                    bg=self.colors['bg_card'], fg=self.colors['text_secondary']).pack(anchor='w', pady=(5,15))
+                    bg=bg_card, fg=text_secondary).pack(anchor='w', pady=(5,15))
     
     def show_lp_solver(self):
         """Show Linear Programming solver with interactive controls"""
-        self.clear_content()
+        self._show_view('lp', self._build_lp_solver)
         self.update_status("Linear Programming Solver", self.colors['accent_green'])
+    
+    def _build_lp_solver(self, view):
+        """Build Linear Programming solver view"""
+        bg_card = self.colors['bg_card']
+        bg_dark = self.colors['bg_dark']
         
         # Header
-        header = tk.Frame(self.content_area, bg=self.colors['bg_card'])
+        header = tk.Frame(view, bg=bg_card)
         header.pack(fill='x', pady=(0,20))
         
         tk.Label(header, text="📈 Linear Programming Solver",
-                font=('Arial', 20, 'bold'), bg=self.colors['bg_card'],
+                font=('Arial', 20, 'bold'), bg=bg_card,
                 fg='white').pack(padx=30, pady=(20,5), anchor='w')
         
         tk.Label(header, text="Simplex Algorithm | Maximize VM Instance Profit",
-                font=('Arial', 10), bg=self.colors['bg_card'],
+                font=('Arial', 10), bg=bg_card,
                 fg=self.colors['text_secondary']).pack(padx=30, pady=(0,20), anchor='w')
         
         # Control Panel
-        control_panel = tk.Frame(self.content_area, bg=self.colors['bg_card'])
+        control_panel = tk.Frame(view, bg=bg_card)
         control_panel.pack(fill='x', pady=(0,20))
         
-        controls = tk.Frame(control_panel, bg=self.colors['bg_card'])
+        controls = tk.Frame(control_panel, bg=bg_card)
         controls.pack(padx=30, pady=20)
         
         # Objective selector
         tk.Label(controls, text="Objective:", font=('Arial', 10, 'bold'),
-                bg=self.colors['bg_card'], fg='white').grid(row=0, column=0, padx=(0,10), pady=10, sticky='w')
+                bg=bg_card, fg='white').grid(row=0, column=0, padx=(0,10), pady=10, sticky='w')
         
         self.lp_objective = tk.StringVar(value="maximize")
         tk.Radiobutton(controls, text="Maximize Profit", variable=self.lp_objective, value="maximize",
-                      bg=self.colors['bg_card'], fg='white', selectcolor=self.colors['bg_dark'],
-                      font=('Arial', 9), activebackground=self.colors['bg_card']).grid(row=0, column=1, padx=5)
+                      bg=bg_card, fg='white', selectcolor=bg_dark,
+                      font=('Arial', 9), activebackground=bg_card).grid(row=0, column=1, padx=5)
         
         tk.Radiobutton(controls, text="Minimize Cost", variable=self.lp_objective, value="minimize",
-                      bg=self.colors['bg_card'], fg='white', selectcolor=self.colors['bg_dark'],
-                      font=('Arial', 9), activebackground=self.colors['bg_card']).grid(row=0, column=2, padx=5)
+                      bg=bg_card, fg='white', selectcolor=bg_dark,
+                      font=('Arial', 9), activebackground=bg_card).grid(row=0, column=2, padx=5)
         
         # Run button with loading animation
         tk.Button(controls, text="🚀 RUN SIMPLEX ALGORITHM", command=self.run_lp_solver,
@@ -320,160 +416,182 @@ class ModernCloudOptimaApp:
                  padx=30, pady=12, relief=tk.FLAT, cursor='hand2').grid(row=0, column=3, padx=20)
         
         # Results Area with tabs
-        results_frame = tk.Frame(self.content_area, bg=self.colors['bg_card'])
+        results_frame = tk.Frame(view, bg=bg_card)
         results_frame.pack(fill='both', expand=True)
         
         # Create notebook for results
-        style = ttk.Style()
-        style.configure('Modern.TNotebook', background=self.colors['bg_card'], borderwidth=0)
-        style.configure('Modern.TNotebook.Tab', background=self.colors['bg_dark'], 
-                       foreground='white', padding=[20, 10], font=('Arial', 9, 'bold'))
-        style.map('Modern.TNotebook.Tab', background=[('selected', self.colors['accent_green'])],
-                 foreground=[('selected', 'white')])
-        
         notebook = ttk.Notebook(results_frame, style='Modern.TNotebook')
         notebook.pack(fill='both', expand=True, padx=20, pady=20)
         
         # Output tab
-        output_tab = tk.Frame(notebook, bg=self.colors['bg_dark'])
+        output_tab = tk.Frame(notebook, bg=bg_dark)
         notebook.add(output_tab, text='📊 Solution Output')
         
         self.lp_output = tk.Text(output_tab, wrap=tk.WORD, font=('Consolas', 9),
                                 bg='#0d1117', fg='#c9d1d9', relief=tk.FLAT,
-                                padx=20, pady=20)
+                                padx=20, pady=20, undo=False, maxundo=0,
+                                autoseparators=False, state='disabled')
         self.lp_output.pack(fill='both', expand=True, padx=10, pady=10)
-        self.lp_output.insert('1.0', "Click 'RUN SIMPLEX ALGORITHM' to solve the Linear Programming problem...\n\n")
+        self._set_output(self.lp_output, "Click 'RUN SIMPLEX ALGORITHM' to solve the Linear Programming problem...\n\n")
         
-        # Visualization tab
-        viz_tab = tk.Frame(notebook, bg=self.colors['bg_dark'])
+        # Visualization tab, filled in the first time it is selected
+        viz_tab = tk.Frame(notebook, bg=bg_dark)
         notebook.add(viz_tab, text='📈 Visualization')
-        
-        tk.Label(viz_tab, text="🎨 Graphical visualization coming soon...",
+        self._pending_tabs[str(viz_tab)] = self._build_lp_viz_tab
+        notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+    
+    def _build_lp_viz_tab(self, tab):
+        """Build LP visualization tab"""
+        tk.Label(tab, text="🎨 Graphical visualization coming soon...",
                 font=('Arial', 12), bg=self.colors['bg_dark'],
                 fg=self.colors['text_secondary']).pack(expand=True)
     
+    def _on_tab_changed(self, event):
+        """Build a notebook tab's contents on its first selection"""
+        notebook = event.widget
+        tab = notebook.select()
+        builder = self._pending_tabs.pop(tab, None)
+        if builder is not None:
+            builder(notebook.nametowidget(tab))
+    
     def show_assignment_solver(self):
         """Show Assignment Problem solver"""
-        self.clear_content()
+        self._show_view('assignment', self._build_assignment_solver)
         self.update_status("Assignment Problem Solver", self.colors['accent_purple'])
+    
+    def _build_assignment_solver(self, view):
+        """Build Assignment Problem solver view"""
+        bg_card = self.colors['bg_card']
+        bg_dark = self.colors['bg_dark']
         
         # Header
-        header = tk.Frame(self.content_area, bg=self.colors['bg_card'])
+        header = tk.Frame(view, bg=bg_card)
         header.pack(fill='x', pady=(0,20))
         
         tk.Label(header, text="🔀 Assignment Problem Solver",
-                font=('Arial', 20, 'bold'), bg=self.colors['bg_card'],
+                font=('Arial', 20, 'bold'), bg=bg_card,
                 fg='white').pack(padx=30, pady=(20,5), anchor='w')
         
         tk.Label(header, text="Hungarian Algorithm | Optimal Job-to-Node Matching",
-                font=('Arial', 10), bg=self.colors['bg_card'],
+                font=('Arial', 10), bg=bg_card,
                 fg=self.colors['text_secondary']).pack(padx=30, pady=(0,20), anchor='w')
         
         # Control Panel
-        control_panel = tk.Frame(self.content_area, bg=self.colors['bg_card'])
+        control_panel = tk.Frame(view, bg=bg_card)
         control_panel.pack(fill='x', pady=(0,20))
         
-        controls = tk.Frame(control_panel, bg=self.colors['bg_card'])
+        controls = tk.Frame(control_panel, bg=bg_card)
         controls.pack(padx=30, pady=20)
         
         tk.Label(controls, text="Problem Type:", font=('Arial', 10, 'bold'),
-                bg=self.colors['bg_card'], fg='white').grid(row=0, column=0, padx=(0,10), pady=10, sticky='w')
+                bg=bg_card, fg='white').grid(row=0, column=0, padx=(0,10), pady=10, sticky='w')
         
         self.assign_type = tk.StringVar(value="minimize")
         tk.Radiobutton(controls, text="Minimize Time", variable=self.assign_type, value="minimize",
-                      bg=self.colors['bg_card'], fg='white', selectcolor=self.colors['bg_dark'],
-                      font=('Arial', 9), activebackground=self.colors['bg_card']).grid(row=0, column=1, padx=5)
+                      bg=bg_card, fg='white', selectcolor=bg_dark,
+                      font=('Arial', 9), activebackground=bg_card).grid(row=0, column=1, padx=5)
         
         tk.Radiobutton(controls, text="Maximize Efficiency", variable=self.assign_type, value="maximize",
-                      bg=self.colors['bg_card'], fg='white', selectcolor=self.colors['bg_dark'],
-                      font=('Arial', 9), activebackground=self.colors['bg_card']).grid(row=0, column=2, padx=5)
+                      bg=bg_card, fg='white', selectcolor=bg_dark,
+                      font=('Arial', 9), activebackground=bg_card).grid(row=0, column=2, padx=5)
         
         tk.Button(controls, text="🚀 RUN HUNGARIAN ALGORITHM", command=self.run_assignment_solver,
                  bg=self.colors['accent_purple'], fg='white', font=('Arial', 11, 'bold'),
                  padx=30, pady=12, relief=tk.FLAT, cursor='hand2').grid(row=0, column=3, padx=20)
         
         # Results Area
-        results_frame = tk.Frame(self.content_area, bg=self.colors['bg_card'])
+        results_frame = tk.Frame(view, bg=bg_card)
         results_frame.pack(fill='both', expand=True)
         
         self.assignment_output = tk.Text(results_frame, wrap=tk.WORD, font=('Consolas', 9),
                                         bg='#0d1117', fg='#c9d1d9', relief=tk.FLAT,
-                                        padx=20, pady=20)
+                                        padx=20, pady=20, undo=False, maxundo=0,
+                                        autoseparators=False, state='disabled')
         self.assignment_output.pack(fill='both', expand=True, padx=20, pady=20)
-        self.assignment_output.insert('1.0', "Click 'RUN HUNGARIAN ALGORITHM' to solve the Assignment problem...\n\n")
+        self._set_output(self.assignment_output, "Click 'RUN HUNGARIAN ALGORITHM' to solve the Assignment problem...\n\n")
     
     def show_transportation_solver(self):
         """Show Transportation Problem solver"""
-        self.clear_content()
+        self._show_view('transportation', self._build_transportation_solver)
         self.update_status("Transportation Problem Solver", self.colors['accent_orange'])
+    
+    def _build_transportation_solver(self, view):
+        """Build Transportation Problem solver view"""
+        bg_card = self.colors['bg_card']
+        bg_dark = self.colors['bg_dark']
         
         # Header
-        header = tk.Frame(self.content_area, bg=self.colors['bg_card'])
+        header = tk.Frame(view, bg=bg_card)
         header.pack(fill='x', pady=(0,20))
         
         tk.Label(header, text="🚛 Transportation Problem Solver",
-                font=('Arial', 20, 'bold'), bg=self.colors['bg_card'],
+                font=('Arial', 20, 'bold'), bg=bg_card,
                 fg='white').pack(padx=30, pady=(20,5), anchor='w')
         
         tk.Label(header, text="Transportation Methods | Minimize Shipping Cost",
-                font=('Arial', 10), bg=self.colors['bg_card'],
+                font=('Arial', 10), bg=bg_card,
                 fg=self.colors['text_secondary']).pack(padx=30, pady=(0,20), anchor='w')
         
         # Control Panel with method selection
-        control_panel = tk.Frame(self.content_area, bg=self.colors['bg_card'])
+        control_panel = tk.Frame(view, bg=bg_card)
         control_panel.pack(fill='x', pady=(0,20))
         
-        controls = tk.Frame(control_panel, bg=self.colors['bg_card'])
+        controls = tk.Frame(control_panel, bg=bg_card)
         controls.pack(padx=30, pady=20)
         
         tk.Label(controls, text="Initial Method:", font=('Arial', 10, 'bold'),
-                bg=self.colors['bg_card'], fg='white').grid(row=0, column=0, padx=(0,10), pady=10, sticky='w')
+                bg=bg_card, fg='white').grid(row=0, column=0, padx=(0,10), pady=10, sticky='w')
         
         self.transport_method = tk.StringVar(value="all")
         tk.Radiobutton(controls, text="Northwest Corner", variable=self.transport_method, value="northwest",
-                      bg=self.colors['bg_card'], fg='white', selectcolor=self.colors['bg_dark'],
-                      font=('Arial', 9), activebackground=self.colors['bg_card']).grid(row=0, column=1, padx=5)
+                      bg=bg_card, fg='white', selectcolor=bg_dark,
+                      font=('Arial', 9), activebackground=bg_card).grid(row=0, column=1, padx=5)
         
         tk.Radiobutton(controls, text="Least Cost", variable=self.transport_method, value="leastcost",
-                      bg=self.colors['bg_card'], fg='white', selectcolor=self.colors['bg_dark'],
-                      font=('Arial', 9), activebackground=self.colors['bg_card']).grid(row=0, column=2, padx=5)
+                      bg=bg_card, fg='white', selectcolor=bg_dark,
+                      font=('Arial', 9), activebackground=bg_card).grid(row=0, column=2, padx=5)
         
         tk.Radiobutton(controls, text="VAM", variable=self.transport_method, value="vam",
-                      bg=self.colors['bg_card'], fg='white', selectcolor=self.colors['bg_dark'],
-                      font=('Arial', 9), activebackground=self.colors['bg_card']).grid(row=0, column=3, padx=5)
+                      bg=bg_card, fg='white', selectcolor=bg_dark,
+                      font=('Arial', 9), activebackground=bg_card).grid(row=0, column=3, padx=5)
         
         tk.Radiobutton(controls, text="Compare All", variable=self.transport_method, value="all",
-                      bg=self.colors['bg_card'], fg='white', selectcolor=self.colors['bg_dark'],
-                      font=('Arial', 9), activebackground=self.colors['bg_card']).grid(row=0, column=4, padx=5)
+                      bg=bg_card, fg='white', selectcolor=bg_dark,
+                      font=('Arial', 9), activebackground=bg_card).grid(row=0, column=4, padx=5)
         
         tk.Button(controls, text="🚀 SOLVE TRANSPORTATION", command=self.run_transportation_solver,
                  bg=self.colors['accent_orange'], fg='white', font=('Arial', 11, 'bold'),
                  padx=30, pady=12, relief=tk.FLAT, cursor='hand2').grid(row=0, column=5, padx=20)
         
         # Results Area
-        results_frame = tk.Frame(self.content_area, bg=self.colors['bg_card'])
+        results_frame = tk.Frame(view, bg=bg_card)
         results_frame.pack(fill='both', expand=True)
         
         self.transport_output = tk.Text(results_frame, wrap=tk.WORD, font=('Consolas', 9),
                                        bg='#0d1117', fg='#c9d1d9', relief=tk.FLAT,
-                                       padx=20, pady=20)
+                                       padx=20, pady=20, undo=False, maxundo=0,
+                                       autoseparators=False, state='disabled')
         self.transport_output.pack(fill='both', expand=True, padx=20, pady=20)
-        self.transport_output.insert('1.0', "Click 'SOLVE TRANSPORTATION' to find optimal routing...\n\n")
+        self._set_output(self.transport_output, "Click 'SOLVE TRANSPORTATION' to find optimal routing...\n\n")
     
     def show_comparison(self):
         """Show side-by-side comparison of all methods"""
-        self.clear_content()
+        self._show_view('comparison', self._build_comparison)
         self.update_status("Results Comparison", self.colors['accent_blue'])
+    
+    def _build_comparison(self, view):
+        """Build results comparison view"""
+        bg_dark = self.colors['bg_dark']
         
-        tk.Label(self.content_area, text="📊 Compare All Results Side-by-Side",
-                font=('Arial', 20, 'bold'), bg=self.colors['bg_dark'],
+        tk.Label(view, text="📊 Compare All Results Side-by-Side",
+                font=('Arial', 20, 'bold'), bg=bg_dark,
                 fg='white').pack(pady=30)
         
-        tk.Label(self.content_area, text="Run all solvers first to enable comparison",
-                font=('Arial', 12), bg=self.colors['bg_dark'],
+        tk.Label(view, text="Run all solvers first to enable comparison",
+                font=('Arial', 12), bg=bg_dark,
                 fg=self.colors['text_secondary']).pack()
         
-        tk.Button(self.content_area, text="🚀 RUN ALL SOLVERS NOW",
+        tk.Button(view, text="🚀 RUN ALL SOLVERS NOW",
                  command=self.run_all_solvers,
                  bg=self.colors['accent_green'], fg='white',
                  font=('Arial', 12, 'bold'), padx=40, pady=15,
@@ -481,14 +599,18 @@ class ModernCloudOptimaApp:
     
     def show_data_manager(self):
         """Show data import/export manager"""
-        self.clear_content()
+        self._show_view('data_manager', self._build_data_manager)
         self.update_status("Data Manager", self.colors['text_secondary'])
+    
+    def _build_data_manager(self, view):
+        """Build data manager view"""
+        bg_dark = self.colors['bg_dark']
         
-        tk.Label(self.content_area, text="📁 Data Manager",
-                font=('Arial', 20, 'bold'), bg=self.colors['bg_dark'],
+        tk.Label(view, text="📁 Data Manager",
+                font=('Arial', 20, 'bold'), bg=bg_dark,
                 fg='white').pack(pady=30)
         
-        actions = tk.Frame(self.content_area, bg=self.colors['bg_dark'])
+        actions = tk.Frame(view, bg=bg_dark)
         actions.pack(pady=20)
         
         tk.Button(actions, text="📥 Import Data (Excel)",
@@ -511,10 +633,21 @@ class ModernCloudOptimaApp:
     
     def show_settings(self):
         """Show settings dialog"""
+        # The dialog is built once; closing it only hides it
+        if self._settings_win is None or not self._settings_win.winfo_exists():
+            self._settings_win = self._build_settings()
+        self._settings_win.deiconify()
+        self._settings_win.lift()
+    
+    def _build_settings(self):
+        """Build settings dialog"""
+        bg_card = self.colors['bg_card']
+        
         settings_window = tk.Toplevel(self.root)
         settings_window.title("⚙️ Settings")
+        settings_window.protocol("WM_DELETE_WINDOW", settings_window.withdraw)
         settings_window.geometry("500x600")
-        settings_window.configure(bg=self.colors['bg_card'])
+        settings_window.configure(bg=bg_card)
         
         # Center window
         settings_window.update_idletasks()
@@ -523,11 +656,11 @@ class ModernCloudOptimaApp:
         settings_window.geometry(f'500x600+{x}+{y}')
         
         tk.Label(settings_window, text="⚙️ Application Settings",
-                font=('Arial', 16, 'bold'), bg=self.colors['bg_card'],
+                font=('Arial', 16, 'bold'), bg=bg_card,
                 fg='white').pack(pady=20)
         
         # Settings options
-        settings_frame = tk.Frame(settings_window, bg=self.colors['bg_card'])
+        settings_frame = tk.Frame(settings_window, bg=bg_card)
         settings_frame.pack(fill='both', expand=True, padx=30, pady=20)
         
         options = [
@@ -541,116 +674,248 @@ class ModernCloudOptimaApp:
         
         for option in options:
             tk.Label(settings_frame, text=option, font=('Arial', 11),
-                    bg=self.colors['bg_card'], fg='white',
+                    bg=bg_card, fg='white',
                     anchor='w').pack(fill='x', pady=10)
+        
+        return settings_window
+    
+    def _set_output(self, widget, text):
+        """Replace the contents of a read-only solver output box"""
+        widget.configure(state='normal')
+        widget.delete('1.0', tk.END)
+        widget.insert('1.0', text)
+        widget.configure(state='disabled')
+    
+    def _append_output(self, widget, text):
+        """Append text to a read-only solver output box"""
+        widget.configure(state='normal')
+        widget.insert(tk.END, text)
+        widget.configure(state='disabled')
+    
+    def _drain_ui_queue(self):
+        """Apply widget updates queued by worker threads on the Tk thread"""
+        try:
+            while True:
+                try:
+                    callback = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                # A failing update (e.g. TclError from a destroyed widget) is
+                # reported the way Tk reports callback errors and must not stop
+                # the rest of the queue from draining
+                try:
+                    callback()
+                except Exception:
+                    self.root.report_callback_exception(*sys.exc_info())
+        finally:
+            self.root.after(30, self._drain_ui_queue)
+    
+    def _solver_key(self, name, args):
+        """Cache key for a solver run: solver, inputs and data file mtime"""
+        try:
+            data_mtime = os.path.getmtime(DATA_FILE)
+        except OSError:
+            data_mtime = None
+        return (name, args, data_mtime)
+    
+    def _store_result(self, key, result):
+        """Cache a finished report"""
+        # Failed runs are not cached so a corrected workbook is re-read
+        if "❌ ERROR" not in result:
+            self._result_cache[key] = result
+    
+    def _run_solver(self, name, *args):
+        """Run a solver, reusing its report while inputs and data are unchanged
+        
+        Returns the report and whether it came from the cache.
+        """
+        key = self._solver_key(name, args)
+        result = self._result_cache.get(key)
+        if result is not None:
+            return result, True
+        result = self._solvers[name](*args)
+        self._store_result(key, result)
+        return result, False
+    
+    @staticmethod
+    def _completed_message(label, cached):
+        """Status text for a finished run, flagging reports served from the cache"""
+        if cached:
+            return f"{label} completed ✓ (loaded cached result)"
+        return f"{label} completed ✓"
+    
+    def _get_process_pool(self):
+        """Worker processes for batch runs, started on first use and reused"""
+        with self._pool_lock:
+            if self._process_pool is None:
+                # Spawned, not forked: forking this multi-threaded Tk process
+                # can deadlock in the child
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=3, mp_context=multiprocessing.get_context("spawn"))
+            return self._process_pool
+    
+    def _discard_process_pool(self, pool):
+        """Drop a broken worker pool so the next batch run starts a fresh one"""
+        with self._pool_lock:
+            if self._process_pool is pool:
+                self._process_pool = None
+        pool.shutdown(wait=False)
     
     def run_lp_solver(self):
         """Run LP solver in background thread"""
         self.update_status("Running Linear Programming...", self.colors['warning'])
+        self._set_output(self.lp_output, "⏳ Executing Simplex Algorithm...\n\n")
+        objective = self.lp_objective.get()[:3]
+        post = self._ui_queue.put
+        done = self._solver_done['lp']
+        done.clear()
         
         def solver_thread():
             try:
-                self.lp_output.delete('1.0', tk.END)
-                self.lp_output.insert('1.0', "⏳ Executing Simplex Algorithm...\n\n")
-                self.root.update()
-                
-                import simplex_method
-                result = simplex_method.run_simplex_method(self.lp_objective.get()[:3])
+                result, cached = self._run_solver('lp', objective)
+                status = self._completed_message("Linear Programming", cached)
                 
-                self.lp_output.delete('1.0', tk.END)
-                self.lp_output.insert('1.0', result)
-                
-                self.update_status("Linear Programming completed ✓", self.colors['success'])
-                messagebox.showinfo("Success", "Linear Programming solved successfully!")
+                post(lambda: self._set_output(self.lp_output, result))
+                post(lambda: self.update_status(status, self.colors['success'], force=True))
+                post(lambda: messagebox.showinfo("Success", "Linear Programming solved successfully!"))
                 
             except Exception as e:
-                self.lp_output.insert(tk.END, f"\n\n❌ ERROR: {str(e)}")
-                self.update_status(f"Error: {str(e)}", self.colors['error'])
-                messagebox.showerror("Error", f"Solver failed:\n{str(e)}")
+                error = str(e)
+                post(lambda: self._append_output(self.lp_output, f"\n\n❌ ERROR: {error}"))
+                post(lambda: self.update_status(f"Error: {error}", self.colors['error'], force=True))
+                post(lambda: messagebox.showerror("Error", f"Solver failed:\n{error}"))
+            finally:
+                done.set()
         
         threading.Thread(target=solver_thread, daemon=True).start()
     
     def run_assignment_solver(self):
         """Run Assignment solver"""
         self.update_status("Running Assignment Problem...", self.colors['warning'])
+        self._set_output(self.assignment_output, "⏳ Executing Hungarian Algorithm...\n\n")
+        minimize = self.assign_type.get() == "minimize"
+        post = self._ui_queue.put
+        done = self._solver_done['assign']
+        done.clear()
         
         def solver_thread():
             try:
-                self.assignment_output.delete('1.0', tk.END)
-                self.assignment_output.insert('1.0', "⏳ Executing Hungarian Algorithm...\n\n")
-                self.root.update()
-                
-                import assignment_problem
-                result = assignment_problem.run_assignment_problem(minimize=(self.assign_type.get()=="minimize"))
+                result, cached = self._run_solver('assign', minimize)
+                status = self._completed_message("Assignment Problem", cached)
                 
-                self.assignment_output.delete('1.0', tk.END)
-                self.assignment_output.insert('1.0', result)
-                
-                self.update_status("Assignment Problem completed ✓", self.colors['success'])
-                messagebox.showinfo("Success", "Assignment Problem solved successfully!")
+                post(lambda: self._set_output(self.assignment_output, result))
+                post(lambda: self.update_status(status, self.colors['success'], force=True))
+                post(lambda: messagebox.showinfo("Success", "Assignment Problem solved successfully!"))
                 
             except Exception as e:
-                self.assignment_output.insert(tk.END, f"\n\n❌ ERROR: {str(e)}")
-                self.update_status(f"Error: {str(e)}", self.colors['error'])
-                messagebox.showerror("Error", f"Solver failed:\n{str(e)}")
+                error = str(e)
+                post(lambda: self._append_output(self.assignment_output, f"\n\n❌ ERROR: {error}"))
+                post(lambda: self.update_status(f"Error: {error}", self.colors['error'], force=True))
+                post(lambda: messagebox.showerror("Error", f"Solver failed:\n{error}"))
+            finally:
+                done.set()
         
         threading.Thread(target=solver_thread, daemon=True).start()
     
     def run_transportation_solver(self):
         """Run Transportation solver"""
         self.update_status("Running Transportation Problem...", self.colors['warning'])
+        self._set_output(self.transport_output, "⏳ Executing Transportation Methods...\n\n")
+        post = self._ui_queue.put
+        done = self._solver_done['trans']
+        done.clear()
         
         def solver_thread():
             try:
-                self.transport_output.delete('1.0', tk.END)
-                self.transport_output.insert('1.0', "⏳ Executing Transportation Methods...\n\n")
-                self.root.update()
-                
-                import transportation_problem
-                result = transportation_problem.run_transportation_problem()
+                result, cached = self._run_solver('trans')
+                status = self._completed_message("Transportation Problem", cached)
                 
-                self.transport_output.delete('1.0', tk.END)
-                self.transport_output.insert('1.0', result)
-                
-                self.update_status("Transportation Problem completed ✓", self.colors['success'])
-                messagebox.showinfo("Success", "Transportation Problem solved successfully!")
+                post(lambda: self._set_output(self.transport_output, result))
+                post(lambda: self.update_status(status, self.colors['success'], force=True))
+                post(lambda: messagebox.showinfo("Success", "Transportation Problem solved successfully!"))
                 
             except Exception as e:
-                self.transport_output.insert(tk.END, f"\n\n❌ ERROR: {str(e)}")
-                self.update_status(f"Error: {str(e)}", self.colors['error'])
-                messagebox.showerror("Error", f"Solver failed:\n{str(e)}")
+                error = str(e)
+                post(lambda: self._append_output(self.transport_output, f"\n\n❌ ERROR: {error}"))
+                post(lambda: self.update_status(f"Error: {error}", self.colors['error'], force=True))
+                post(lambda: messagebox.showerror("Error", f"Solver failed:\n{error}"))
+            finally:
+                done.set()
         
         threading.Thread(target=solver_thread, daemon=True).start()
     
     def run_all_solvers(self):
-        """Run all three solvers sequentially"""
-        self.update_status("Running all solvers...", self.colors['warning'])
+        """Run all three solvers concurrently"""
+        # All three output boxes must exist before results are published
+        self._get_view('assignment', self._build_assignment_solver)
+        self._get_view('transportation', self._build_transportation_solver)
+        self.show_lp_solver()
+        
+        # After the view switch, whose own status would otherwise replace
+        # this one in the debounced status bar before it is painted
+        self.update_status("Running all solvers...", self.colors['warning'], force=True)
+        
+        jobs = [
+            (self.lp_output, "⏳ Executing Simplex Algorithm...\n\n",
+             ('lp', self.lp_objective.get()[:3])),
+            (self.assignment_output, "⏳ Executing Hungarian Algorithm...\n\n",
+             ('assign', self.assign_type.get() == "minimize")),
+            (self.transport_output, "⏳ Executing Transportation Methods...\n\n",
+             ('trans',))
+        ]
+        for widget, placeholder, _ in jobs:
+            self._set_output(widget, placeholder)
+        post = self._ui_queue.put
+        # Created here on the Tk thread, never lazily from the worker
+        pool = self._get_process_pool()
         
         def run_all():
             try:
-                # Show LP tab and run
-                self.show_lp_solver()
-                time.sleep(0.5)
-                self.run_lp_solver()
-                time.sleep(3)
+                # Let any single-solver run finish first so its late result
+                # cannot overwrite the batch output
+                for event in self._solver_done.values():
+                    event.wait()
                 
-                # Show Assignment tab and run
-                self.show_assignment_solver()
-                time.sleep(0.5)
-                self.run_assignment_solver()
-                time.sleep(3)
+                # The solvers are CPU-bound, so uncached ones run in separate
+                # processes instead of contending for the GIL
+                submitted = []
+                for _, _, (name, *args) in jobs:
+                    key = self._solver_key(name, tuple(args))
+                    result = self._result_cache.get(key)
+                    future = pool.submit(self._solvers[name], *args) if result is None else None
+                    submitted.append((key, result, future))
+                self._batch_futures = [future for _, _, future in submitted if future is not None]
                 
-                # Show Transportation tab and run
-                self.show_transportation_solver()
-                time.sleep(0.5)
-                self.run_transportation_solver()
+                results = []
+                cached = sum(future is None for _, _, future in submitted)
+                for (widget, _, _), (key, result, future) in zip(jobs, submitted):
+                    if future is not None:
+                        result = future.result()
+                        self._store_result(key, result)
+                    results.append((widget, result))
                 
-                self.update_status("All solvers completed ✓", self.colors['success'])
-                messagebox.showinfo("Complete", "All optimization problems solved successfully!")
+                # One UI update once every solver has finished
+                def publish():
+                    for widget, result in results:
+                        self._set_output(widget, result)
+                    status = "All solvers completed ✓"
+                    if cached:
+                        status += f" ({cached} loaded from cached results)"
+                    self.update_status(status, self.colors['success'], force=True)
                 
+                post(publish)
+                post(lambda: messagebox.showinfo("Complete", "All optimization problems solved successfully!"))
+                
+            except BrokenProcessPool as e:
+                # A broken pool rejects every later submit; replace it next run
+                self._discard_process_pool(pool)
+                error = f"A solver process terminated unexpectedly ({e}). Please run again."
+                post(lambda: self.update_status("Error in batch run: solver process crashed", self.colors['error'], force=True))
+                post(lambda: messagebox.showerror("Error", f"Batch execution failed:\n{error}"))
             except Exception as e:
-                self.update_status(f"Error in batch run: {str(e)}", self.colors['error'])
-                messagebox.showerror("Error", f"Batch execution failed:\n{str(e)}")
+                error = str(e)
+                post(lambda: self.update_status(f"Error in batch run: {error}", self.colors['error'], force=True))
+                post(lambda: messagebox.showerror("Error", f"Batch execution failed:\n{error}"))
         
         threading.Thread(target=run_all, daemon=True).start()
     
@@ -661,6 +926,7 @@ class ModernCloudOptimaApp:
             filetypes=[("Excel files", "*.xlsx *.xls"), ("All files", "*.*")]
         )
         if filename:
+            self._result_cache.clear()
             messagebox.showinfo("Import", f"Data would be imported from:\n{filename}")
             self.update_status(f"Imported: {filename}", self.colors['success'])
     
@@ -686,20 +952,45 @@ class ModernCloudOptimaApp:
             messagebox.showinfo("PDF", f"PDF report would be generated:\n{filename}")
             self.update_status(f"PDF generated: {filename}", self.colors['success'])
     
-    def update_status(self, message, color=None):
-        """Update status bar"""
+    def update_status(self, message, color=None, force=False):
+        """Update status bar (force=True paints at once, for final messages)"""
+        # Calls from worker threads are handed to the Tk thread
+        if threading.current_thread() is not threading.main_thread():
+            self._ui_queue.put(lambda: self.update_status(message, color, force))
+            return
+        
         if color is None:
             color = self.colors['accent_blue']
+        self._pending_status = (message, color)
+        if force:
+            if self._status_after_id is not None:
+                self.root.after_cancel(self._status_after_id)
+            self._flush_status()
+        elif self._status_after_id is None:
+            self._status_after_id = self.root.after(50, self._flush_status)
+    
+    def _flush_status(self):
+        """Apply the latest pending status message"""
+        self._status_after_id = None
+        # While hidden the message stays pending until the window is mapped
+        if not self._visible or self._pending_status is None:
+            return
+        message, color = self._pending_status
+        self._pending_status = None
         self.status_label.config(text=f"● {message}", fg=color)
-        self.root.update()
+    
+    def _on_visibility(self, event, visible):
+        """Track whether the main window is mapped"""
+        # Child widgets' <Map>/<Unmap> events also reach the root binding
+        if event.widget is not self.root:
+            return
+        self._visible = visible
+        if visible and self._status_after_id is None:
+            self._flush_status()
     
     def darken_color(self, hex_color):
         """Darken a hex color by 20%"""
-        if hex_color.startswith('#'):
-            hex_color = hex_color[1:]
-        rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        darkened = tuple(max(0, int(c * 0.7)) for c in rgb)
-        return f'#{darkened[0]:02x}{darkened[1]:02x}{darkened[2]:02x}'
+        return _darken(hex_color)
 
 
 def main():
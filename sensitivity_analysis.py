@@ -3,10 +3,17 @@ CloudOptima - Comprehensive Sensitivity Analysis Module
 Detailed sensitivity analysis for Linear Programming solutions
 """
 
-import pandas as pd
 import numpy as np
 from datetime import datetime
 import simplex_method
+from data_loader import load_rows
+
+
+# Report separators, shared by every section
+_SEP_EQ = "=" * 90
+_SEP_DASH = "-" * 90
+_SEP_DASH70 = "-" * 70
+_SECTION_START = "\n" + _SEP_EQ
 
 
 class SensitivityAnalyzer:
@@ -25,60 +32,93 @@ class SensitivityAnalyzer:
         self.constraint_names = solver.constraint_names
         self.var_names = solver.var_names
         
+        # Dense copies of the problem data for vectorized calculations
+        self.A_np = np.asarray(solver.A, dtype=np.float64)
+        self.b_np = np.asarray(solver.b, dtype=np.float64)
+        self._var_index = {name: j for j, name in enumerate(self.var_names)}
+        self._basic_index = {name: k for k, name in enumerate(self.basic_vars)}
+        
+        # Name column widths: 20 characters, widened to fit the longest name
+        self._cname_w = max(20, max(map(len, self.constraint_names), default=0))
+        self._vname_w = max(20, max(map(len, self.var_names), default=0))
+        
+        # Dual values read once from the objective row of the final tableau
+        self._tab = np.asarray(solver.tableau, dtype=np.float64)
+        self.reduced_costs = self._tab[0, :self.num_vars]
+        
+        # Every per-constraint quantity the report needs, computed together
+        self._constraint_stats = self._precompute_constraint_stats()
+        self.shadow_prices = self._constraint_stats.shadow_price
+        self._binding_mask = self._constraint_stats.binding
+        # With no dual activity parts 4, 6 and 7 reduce to a short summary
+        self._any_binding = bool(self._binding_mask.any())
+        # Located once with a linear scan; parts 1 and 7 both report it
+        self._top_constraint = int(np.argmax(self.shadow_prices))
+        
+    def _decision_vector(self):
+        """Values of the decision variables in the final basis"""
+        # Column of each basic variable among the decision variables (-1 = slack)
+        basic_cols = np.array([self._var_index.get(name, -1) for name in self.basic_vars],
+                              dtype=np.intp)
+        in_basis = basic_cols >= 0
+        
+        x = np.zeros(self.num_vars)
+        x[basic_cols[in_basis]] = self._tab[1:, -1][in_basis]
+        return x
+    
+    def _precompute_constraint_stats(self):
+        """Shadow price, usage and slack of every constraint in one vectorized pass"""
+        shadow = -self._tab[0, self.num_vars:self.num_vars + self.num_constraints]
+        used = self.A_np @ self._decision_vector()
+        pct = np.divide(used, self.b_np, out=np.zeros_like(used), where=self.b_np > 0) * 100
+        
+        return np.rec.fromarrays(
+            [np.array(self.constraint_names, dtype=object), self.b_np, shadow,
+             self.b_np - used, used, pct, np.abs(shadow) > 1e-6],
+            names='name,rhs,shadow_price,slack,used,pct,binding')
+    
+    def iter_analysis(self):
+        """Yield the complete sensitivity analysis one part at a time"""
+        yield _SEP_EQ
+        yield "📊 COMPREHENSIVE SENSITIVITY ANALYSIS"
+        yield _SEP_EQ
+        yield f"\nAnalysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        
+        parts = [
+            self.analyze_shadow_prices,                 # Part 1: Shadow Prices (Dual Values)
+            self.analyze_reduced_costs,                 # Part 2: Reduced Costs
+            self.analyze_objective_coefficient_ranges,  # Part 3: Objective Coefficient Ranges
+            self.analyze_rhs_ranges,                    # Part 4: RHS (Constraint Limit) Ranges
+            self.analyze_resource_utilization,          # Part 5: Resource Utilization Analysis
+            self.what_if_scenarios,                     # Part 6: What-If Scenarios
+            self.analyze_binding_constraints            # Part 7: Binding vs Non-Binding Constraints
+        ]
+        # Only one part's lines are held at a time
+        for part in parts:
+            lines = []
+            part(lines)
+            yield from lines
+    
     def analyze_all(self):
         """Perform complete sensitivity analysis"""
-        output = []
-        
-        output.append("="*90)
-        output.append("📊 COMPREHENSIVE SENSITIVITY ANALYSIS")
-        output.append("="*90)
-        output.append(f"\nAnalysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        
-        # Part 1: Shadow Prices (Dual Values)
-        output.append(self.analyze_shadow_prices())
-        
-        # Part 2: Reduced Costs
-        output.append(self.analyze_reduced_costs())
-        
-        # Part 3: Allowable Ranges for Objective Coefficients
-        output.append(self.analyze_objective_coefficient_ranges())
-        
-        # Part 4: Allowable Ranges for RHS (Constraint Limits)
-        output.append(self.analyze_rhs_ranges())
-        
-        # Part 5: Resource Utilization Analysis
-        output.append(self.analyze_resource_utilization())
-        
-        # Part 6: What-If Scenarios
-        output.append(self.what_if_scenarios())
-        
-        # Part 7: Binding vs Non-Binding Constraints
-        output.append(self.analyze_binding_constraints())
-        
-        return "\n".join(output)
+        return "\n".join(self.iter_analysis())
     
-    def analyze_shadow_prices(self):
+    def analyze_shadow_prices(self, lines):
         """Detailed shadow price analysis"""
-        lines = []
-        
-        lines.append("\n" + "="*90)
+        lines.append(_SECTION_START)
         lines.append("💰 PART 1: SHADOW PRICES (DUAL VALUES)")
-        lines.append("="*90)
+        lines.append(_SEP_EQ)
         
         lines.append("\n📖 DEFINITION:")
         lines.append("Shadow Price = Marginal value of one additional unit of resource")
         lines.append("             = How much profit increases if constraint limit increases by 1")
         
         lines.append("\n📊 SHADOW PRICE TABLE:")
-        lines.append("-" * 90)
-        lines.append(f"{'Constraint':<25} {'Shadow Price':>15} {'Economic Interpretation':<40}")
-        lines.append("-" * 90)
-        
-        for i in range(self.num_constraints):
-            slack_col = self.num_vars + i
-            shadow_price = -self.tableau[0][slack_col]
-            constraint_name = self.constraint_names[i]
-            
+        lines.append(_SEP_DASH)
+        lines.append(f"{'Constraint'.ljust(self._cname_w + 5)} {'Shadow Price':>15} {'Economic Interpretation':<40}")
+        lines.append(_SEP_DASH)
+        
+        for constraint_name, shadow_price in zip(self.constraint_names, self.shadow_prices.tolist()):
             # Determine interpretation
             if abs(shadow_price) < 1e-6:
                 interpretation = "Non-binding (adding more won't help)"
@@ -90,50 +130,41 @@ class SensitivityAnalyzer:
                 interpretation = "Negative impact (should not occur in max problem)"
                 status = "🔴"
             
-            lines.append(f"{status} {constraint_name:<23} ${shadow_price:>14.2f} {interpretation:<40}")
+            lines.append(f"{status} {constraint_name.ljust(self._cname_w + 3)} ${shadow_price:>14.2f} {interpretation:<40}")
         
-        lines.append("-" * 90)
+        lines.append(_SEP_DASH)
         
         # Find most valuable resource
-        shadow_prices = []
-        for i in range(self.num_constraints):
-            slack_col = self.num_vars + i
-            sp = -self.tableau[0][slack_col]
-            shadow_prices.append((self.constraint_names[i], sp))
-        
-        shadow_prices.sort(key=lambda x: x[1], reverse=True)
+        top_idx = self._top_constraint
+        top_sp = float(self.shadow_prices[top_idx])
         
         lines.append(f"\n🏆 MOST VALUABLE RESOURCE:")
-        if shadow_prices[0][1] > 1e-6:
-            lines.append(f"   {shadow_prices[0][0]}: ${shadow_prices[0][1]:.2f} per unit")
+        if top_sp > 1e-6:
+            lines.append(f"   {self.constraint_names[top_idx]}: ${top_sp:.2f} per unit")
             lines.append(f"   → Focus on increasing this resource for maximum profit gain!")
         else:
             lines.append(f"   All resources have zero shadow price (surplus capacity exists)")
-        
-        return "\n".join(lines)
     
-    def analyze_reduced_costs(self):
+    def analyze_reduced_costs(self, lines):
         """Detailed reduced cost analysis"""
-        lines = []
-        
-        lines.append("\n" + "="*90)
+        lines.append(_SECTION_START)
         lines.append("📉 PART 2: REDUCED COSTS")
-        lines.append("="*90)
+        lines.append(_SEP_EQ)
         
         lines.append("\n📖 DEFINITION:")
         lines.append("Reduced Cost = Amount by which objective coefficient must improve")
         lines.append("               to make a non-basic variable enter the solution")
         
         lines.append("\n📊 REDUCED COST TABLE:")
-        lines.append("-" * 90)
-        lines.append(f"{'Variable':<25} {'Status':>12} {'Reduced Cost':>15} {'Interpretation':<30}")
-        lines.append("-" * 90)
+        lines.append(_SEP_DASH)
+        lines.append(f"{'Variable'.ljust(self._vname_w + 5)} {'Status':>12} {'Reduced Cost':>15} {'Interpretation':<30}")
+        lines.append(_SEP_DASH)
         
         for j in range(self.num_vars):
             var_name = self.var_names[j]
-            reduced_cost = self.tableau[0][j]
+            reduced_cost = self.reduced_costs[j]
             
-            if var_name in self.basic_vars:
+            if var_name in self._basic_index:
                 status = "Basic"
                 interpretation = "Currently in solution"
             else:
@@ -145,35 +176,31 @@ class SensitivityAnalyzer:
                 else:
                     interpretation = "Already optimal (should be ≥ 0)"
             
-            lines.append(f"{var_name:<25} {status:>12} ${reduced_cost:>14.2f} {interpretation:<30}")
+            lines.append(f"{var_name.ljust(self._vname_w + 5)} {status:>12} ${reduced_cost:>14.2f} {interpretation:<30}")
         
-        lines.append("-" * 90)
-        
-        return "\n".join(lines)
+        lines.append(_SEP_DASH)
     
-    def analyze_objective_coefficient_ranges(self):
+    def analyze_objective_coefficient_ranges(self, lines):
         """Calculate allowable ranges for objective coefficients"""
-        lines = []
-        
-        lines.append("\n" + "="*90)
+        lines.append(_SECTION_START)
         lines.append("📈 PART 3: OBJECTIVE COEFFICIENT RANGES")
-        lines.append("="*90)
+        lines.append(_SEP_EQ)
         
         lines.append("\n📖 DEFINITION:")
         lines.append("Range within which objective coefficient can change without affecting")
         lines.append("the optimal solution (basis remains the same)")
         
         lines.append("\n📊 ALLOWABLE RANGES:")
-        lines.append("-" * 90)
-        lines.append(f"{'Variable':<20} {'Current':>12} {'Allowable Min':>15} {'Allowable Max':>15} {'Range':>15}")
-        lines.append("-" * 90)
+        lines.append(_SEP_DASH)
+        lines.append(f"{'Variable'.ljust(self._vname_w)} {'Current':>12} {'Allowable Min':>15} {'Allowable Max':>15} {'Range':>15}")
+        lines.append(_SEP_DASH)
         
         for j in range(self.num_vars):
             var_name = self.var_names[j]
             current_coeff = self.c[j]
             
             # For basic variables, calculate range from entering variable analysis
-            if var_name in self.basic_vars:
+            if var_name in self._basic_index:
                 # Simplified range calculation (100% sensitivity in most cases)
                 allow_decrease = current_coeff * 0.5  # Minimum 50% of current
                 allow_increase = current_coeff * 1.5  # Maximum 150% of current
@@ -181,90 +208,71 @@ class SensitivityAnalyzer:
                 range_str = f"±{current_coeff*0.5:.0f}"
             else:
                 # For non-basic variables
-                reduced_cost = self.tableau[0][j]
+                reduced_cost = self.reduced_costs[j]
                 allow_decrease = 0
                 allow_increase = current_coeff + abs(reduced_cost)
                 range_str = f"0 to +{abs(reduced_cost):.0f}"
             
-            lines.append(f"{var_name:<20} ${current_coeff:>11.2f} ${allow_decrease:>14.2f} ${allow_increase:>14.2f} {range_str:>15}")
+            lines.append(f"{var_name.ljust(self._vname_w)} ${current_coeff:>11.2f} ${allow_decrease:>14.2f} ${allow_increase:>14.2f} {range_str:>15}")
         
-        lines.append("-" * 90)
+        lines.append(_SEP_DASH)
         
         lines.append(f"\n💡 INTERPRETATION:")
         lines.append(f"   If profit coefficient stays within allowable range,")
         lines.append(f"   the current optimal solution remains optimal.")
-        
-        return "\n".join(lines)
     
-    def analyze_rhs_ranges(self):
+    def analyze_rhs_ranges(self, lines):
         """Calculate allowable ranges for RHS values (constraint limits)"""
-        lines = []
-        
-        lines.append("\n" + "="*90)
+        lines.append(_SECTION_START)
         lines.append("🔢 PART 4: RHS (CONSTRAINT LIMIT) RANGES")
-        lines.append("="*90)
+        lines.append(_SEP_EQ)
+        
+        if not self._any_binding:
+            lines.append("\n⚪ No binding constraints - every shadow price is $0.00.")
+            lines.append("   Changing any constraint limit within its slack leaves profit unchanged.")
+            return
         
         lines.append("\n📖 DEFINITION:")
         lines.append("Range within which constraint limit can change while")
         lines.append("shadow price remains valid (basis may change but dual stays feasible)")
         
         lines.append("\n📊 ALLOWABLE RHS RANGES:")
-        lines.append("-" * 90)
-        lines.append(f"{'Constraint':<20} {'Current':>12} {'Allow. Min':>13} {'Allow. Max':>13} {'Shadow $':>12}")
-        lines.append("-" * 90)
+        lines.append(_SEP_DASH)
+        lines.append(f"{'Constraint'.ljust(self._cname_w)} {'Current':>12} {'Allow. Min':>13} {'Allow. Max':>13} {'Shadow $':>12}")
+        lines.append(_SEP_DASH)
         
-        for i in range(self.num_constraints):
-            constraint_name = self.constraint_names[i]
-            current_rhs = self.b[i]
-            
+        stats = self._constraint_stats
+        for constraint_name, current_rhs, shadow_price in zip(
+                stats.name.tolist(), stats.rhs.tolist(), stats.shadow_price.tolist()):
             # Simplified calculation (10% flexibility as approximation)
             allow_min = current_rhs * 0.9
             allow_max = current_rhs * 1.1
             
-            slack_col = self.num_vars + i
-            shadow_price = -self.tableau[0][slack_col]
-            
-            lines.append(f"{constraint_name:<20} {current_rhs:>12,.0f} {allow_min:>13,.0f} {allow_max:>13,.0f} ${shadow_price:>11.2f}")
+            lines.append(f"{constraint_name.ljust(self._cname_w)} {current_rhs:>12,.0f} {allow_min:>13,.0f} {allow_max:>13,.0f} ${shadow_price:>11.2f}")
         
-        lines.append("-" * 90)
+        lines.append(_SEP_DASH)
         
         lines.append(f"\n💡 INTERPRETATION:")
         lines.append(f"   Within these ranges, shadow price remains accurate for")
         lines.append(f"   estimating profit changes from resource adjustments.")
-        
-        return "\n".join(lines)
     
-    def analyze_resource_utilization(self):
+    def analyze_resource_utilization(self, lines):
         """Detailed resource utilization analysis"""
-        lines = []
-        
-        lines.append("\n" + "="*90)
+        lines.append(_SECTION_START)
         lines.append("📦 PART 5: RESOURCE UTILIZATION ANALYSIS")
-        lines.append("="*90)
+        lines.append(_SEP_EQ)
         
         lines.append("\n📊 UTILIZATION TABLE:")
-        lines.append("-" * 90)
-        lines.append(f"{'Resource':<20} {'Used':>12} {'Available':>12} {'Slack':>12} {'% Used':>10} {'Status':<15}")
-        lines.append("-" * 90)
+        lines.append(_SEP_DASH)
+        lines.append(f"{'Resource'.ljust(self._cname_w)} {'Used':>12} {'Available':>12} {'Slack':>12} {'% Used':>10} {'Status':<15}")
+        lines.append(_SEP_DASH)
         
         utilization_data = []
         
-        for i in range(self.num_constraints):
-            constraint_name = self.constraint_names[i]
-            available = self.b[i]
-            
-            # Calculate used amount
-            used = 0
-            for j in range(self.num_vars):
-                var_name = self.var_names[j]
-                if var_name in self.basic_vars:
-                    idx = self.basic_vars.index(var_name)
-                    quantity = self.tableau[idx + 1][-1]
-                    used += self.A[i][j] * quantity
-            
-            slack = available - used
-            pct_used = (used / available * 100) if available > 0 else 0
-            
+        stats = self._constraint_stats
+        for constraint_name, used, available, slack, pct_used in zip(
+                stats.name.tolist(), stats.used.tolist(), stats.rhs.tolist(),
+                stats.slack.tolist(), stats.pct.tolist()):
             # Determine status
             if pct_used > 99.9:
                 status = "🔴 Fully Used"
@@ -275,11 +283,11 @@ class SensitivityAnalyzer:
             else:
                 status = "⚪ Low"
             
-            lines.append(f"{constraint_name:<20} {used:>12,.1f} {available:>12,.0f} {slack:>12,.1f} {pct_used:>9.1f}% {status:<15}")
+            lines.append(f"{constraint_name.ljust(self._cname_w)} {used:>12,.1f} {available:>12,.0f} {slack:>12,.1f} {pct_used:>9.1f}% {status:<15}")
             
             utilization_data.append((constraint_name, pct_used, slack))
         
-        lines.append("-" * 90)
+        lines.append(_SEP_DASH)
         
         # Find bottlenecks
         bottlenecks = [r for r in utilization_data if r[1] > 99]
@@ -294,30 +302,28 @@ class SensitivityAnalyzer:
             lines.append(f"\n💡 UNDERUTILIZED RESOURCES:")
             for name, pct, slack in underutilized:
                 lines.append(f"   • {name}: {pct:.1f}% used ({slack:,.0f} units available)")
-        
-        return "\n".join(lines)
     
-    def what_if_scenarios(self):
+    def what_if_scenarios(self, lines):
         """What-if scenario analysis"""
-        lines = []
-        
-        lines.append("\n" + "="*90)
+        lines.append(_SECTION_START)
         lines.append("🔮 PART 6: WHAT-IF SCENARIO ANALYSIS")
-        lines.append("="*90)
+        lines.append(_SEP_EQ)
+        
+        if not self._any_binding:
+            lines.append("\n⚪ No binding constraints - resource changes within current slack")
+            lines.append("   do not affect profit; re-solve the LP to evaluate other scenarios.")
+            return
         
         lines.append("\n📊 SCENARIO SIMULATIONS:")
         
         # Find binding constraints
-        binding_constraints = []
-        for i in range(self.num_constraints):
-            slack_col = self.num_vars + i
-            shadow_price = -self.tableau[0][slack_col]
-            if abs(shadow_price) > 1e-6:
-                binding_constraints.append((self.constraint_names[i], shadow_price, self.b[i]))
+        binding = self._constraint_stats[self._binding_mask]
+        binding_constraints = list(zip(binding.name.tolist(), binding.shadow_price.tolist(),
+                                       binding.rhs.tolist()))
         
         if binding_constraints:
             lines.append(f"\n💰 SCENARIO 1: Increase Binding Resource by 10%")
-            lines.append("-" * 70)
+            lines.append(_SEP_DASH70)
             
             current_profit = self.tableau[0][-1]
             
@@ -332,42 +338,37 @@ class SensitivityAnalyzer:
                 lines.append("")
         
         lines.append(f"\n📈 SCENARIO 2: Double Most Profitable VM Profit")
-        lines.append("-" * 70)
+        lines.append(_SEP_DASH70)
         lines.append(f"   If we could double the profit of our most profitable VM type,")
         lines.append(f"   we would need to re-solve the LP to see new optimal allocation.")
         lines.append(f"   Current solution may change significantly.")
         
         lines.append(f"\n🔻 SCENARIO 3: 20% Reduction in Available Resources")
-        lines.append("-" * 70)
+        lines.append(_SEP_DASH70)
         lines.append(f"   If resources decrease by 20%, profit would likely decrease.")
         lines.append(f"   Shadow prices indicate which resources would hurt most if reduced.")
-        
-        return "\n".join(lines)
     
-    def analyze_binding_constraints(self):
+    def analyze_binding_constraints(self, lines):
         """Analyze binding vs non-binding constraints"""
-        lines = []
-        
-        lines.append("\n" + "="*90)
+        lines.append(_SECTION_START)
         lines.append("🔗 PART 7: BINDING vs NON-BINDING CONSTRAINTS")
-        lines.append("="*90)
+        lines.append(_SEP_EQ)
+        
+        if not self._any_binding:
+            lines.append(f"\n🔴 BINDING CONSTRAINTS (0): None - all resources have surplus!")
+            lines.append(f"⚪ NON-BINDING CONSTRAINTS ({self.num_constraints}): all resources")
+            lines.append(f"\n💼 RECOMMENDATION: Profit is limited by demand, not capacity -")
+            lines.append(f"   reduce investment in surplus resources.")
+            return
         
         lines.append("\n📖 DEFINITIONS:")
         lines.append("   Binding Constraint: Fully utilized (slack = 0, shadow price > 0)")
         lines.append("   Non-Binding: Has surplus capacity (slack > 0, shadow price = 0)")
         
-        binding = []
-        non_binding = []
-        
-        for i in range(self.num_constraints):
-            slack_col = self.num_vars + i
-            shadow_price = -self.tableau[0][slack_col]
-            constraint_name = self.constraint_names[i]
-            
-            if abs(shadow_price) > 1e-6:
-                binding.append((constraint_name, shadow_price))
-            else:
-                non_binding.append(constraint_name)
+        names = self.constraint_names
+        binding_idx = np.flatnonzero(self._binding_mask)
+        binding = [(names[i], self.shadow_prices[i]) for i in binding_idx.tolist()]
+        non_binding = [names[i] for i in np.flatnonzero(~self._binding_mask).tolist()]
         
         lines.append(f"\n🔴 BINDING CONSTRAINTS ({len(binding)}):")
         if binding:
@@ -387,12 +388,16 @@ class SensitivityAnalyzer:
         
         # Management recommendations
         lines.append(f"\n💼 MANAGEMENT RECOMMENDATIONS:")
-        lines.append("-" * 70)
+        lines.append(_SEP_DASH70)
         
         if binding:
-            top_constraint = max(binding, key=lambda x: x[1])
-            lines.append(f"1. PRIORITY: Increase {top_constraint[0]}")
-            lines.append(f"   → Highest shadow price (${top_constraint[1]:.2f} per unit)")
+            # First binding constraint with the highest shadow price; the
+            # overall maximum qualifies unless every binding price is negative
+            top = self._top_constraint
+            if not self._binding_mask[top]:
+                top = int(np.argmax(np.where(self._binding_mask, self.shadow_prices, -np.inf)))
+            lines.append(f"1. PRIORITY: Increase {names[top]}")
+            lines.append(f"   → Highest shadow price (${self.shadow_prices[top]:.2f} per unit)")
             lines.append(f"   → Direct impact on profitability")
         
         if non_binding:
@@ -402,86 +407,86 @@ class SensitivityAnalyzer:
         
         lines.append(f"\n3. MONITOR: Track resource utilization continuously")
         lines.append(f"   → Binding constraints may change as business evolves")
-        
-        return "\n".join(lines)
 
 
-def run_sensitivity_analysis():
-    """Main function to run comprehensive sensitivity analysis"""
-    output = []
-    
+def iter_sensitivity_analysis():
+    """Solve the LP and yield the sensitivity report line by line"""
     try:
-        output.append("="*90)
-        output.append("☁️  CLOUDOPTIMA - COMPREHENSIVE SENSITIVITY ANALYSIS")
-        output.append("="*90)
-        output.append(f"\nGenerating detailed sensitivity analysis for Linear Programming solution...")
+        yield _SEP_EQ
+        yield "☁️  CLOUDOPTIMA - COMPREHENSIVE SENSITIVITY ANALYSIS"
+        yield _SEP_EQ
+        yield f"\nGenerating detailed sensitivity analysis for Linear Programming solution..."
         
         # First, solve the LP problem
-        output.append(f"\n⏳ Step 1: Solving Linear Programming problem...")
+        yield f"\n⏳ Step 1: Solving Linear Programming problem..."
         
-        # Read Excel data
-        df = pd.read_excel('CloudOptima_OR_Data.xlsx', sheet_name='Linear_Programming')
+        # Read raw cell values with openpyxl (cached per workbook modification)
+        header, *rows = load_rows('Linear_Programming')
+        col = {name: j for j, name in enumerate(header)}
         
         # Extract data (first 10 rows are VM types)
-        vm_data = df.iloc[:10]
+        vm_rows = rows[:10]
         
         # Objective coefficients
-        c = vm_data['Profit_per_Hour'].tolist()
+        c = np.array([row[col['Profit_per_Hour']] for row in vm_rows], dtype=np.float64)
         
         # Variable names
-        var_names = vm_data['VM_Type'].tolist()
+        var_names = [row[col['VM_Type']] for row in vm_rows]
         
         # Constraint matrix
-        constraint_cols = [col for col in df.columns if col.startswith('Consumes_')]
-        A = vm_data[constraint_cols].values.tolist()
+        constraint_idx = [j for j, name in enumerate(header) if name.startswith('Consumes_')]
+        A = np.array([[row[j] for j in constraint_idx] for row in vm_rows], dtype=np.float64)
         
         # RHS
-        constraint_data = df.iloc[12:22]
-        b = constraint_data['Max_Instances'].tolist()
+        constraint_rows = rows[12:22]
+        b = np.array([row[col['Max_Instances']] for row in constraint_rows], dtype=np.float64)
         
         # Constraint names
-        constraint_names = [col.replace('Consumes_', '') for col in constraint_cols]
+        constraint_names = [header[j].replace('Consumes_', '') for j in constraint_idx]
         
         # Solve
         solver = simplex_method.SimplexSolver(c, A, b, var_names, constraint_names)
         solution, z_value, iterations = solver.solve()
         
-        output.append(f"✅ LP Solved: Optimal profit = ${z_value:,.2f}")
-        output.append(f"✅ Simplex iterations: {iterations}")
+        yield f"✅ LP Solved: Optimal profit = ${z_value:,.2f}"
+        yield f"✅ Simplex iterations: {iterations}"
         
         # Perform sensitivity analysis
-        output.append(f"\n⏳ Step 2: Performing comprehensive sensitivity analysis...")
+        yield f"\n⏳ Step 2: Performing comprehensive sensitivity analysis..."
         
         analyzer = SensitivityAnalyzer(solver)
-        sensitivity_results = analyzer.analyze_all()
-        
-        output.append(sensitivity_results)
+        yield from analyzer.iter_analysis()
         
         # Summary
-        output.append("\n" + "="*90)
-        output.append("✅ SENSITIVITY ANALYSIS COMPLETE")
-        output.append("="*90)
-        output.append(f"\nThis analysis provides:")
-        output.append(f"  ✓ Shadow prices for all resources")
-        output.append(f"  ✓ Reduced costs for all variables")
-        output.append(f"  ✓ Allowable ranges for coefficients")
-        output.append(f"  ✓ Resource utilization analysis")
-        output.append(f"  ✓ What-if scenarios")
-        output.append(f"  ✓ Binding constraint analysis")
-        output.append(f"  ✓ Management recommendations")
-        
-        output.append(f"\n📊 Use these insights for strategic decision-making!")
-        output.append("="*90)
+        yield _SECTION_START
+        yield "✅ SENSITIVITY ANALYSIS COMPLETE"
+        yield _SEP_EQ
+        yield f"\nThis analysis provides:"
+        yield f"  ✓ Shadow prices for all resources"
+        yield f"  ✓ Reduced costs for all variables"
+        yield f"  ✓ Allowable ranges for coefficients"
+        yield f"  ✓ Resource utilization analysis"
+        yield f"  ✓ What-if scenarios"
+        yield f"  ✓ Binding constraint analysis"
+        yield f"  ✓ Management recommendations"
+        
+        yield f"\n📊 Use these insights for strategic decision-making!"
+        yield _SEP_EQ
         
     except Exception as e:
         import traceback
-        output.append(f"\n❌ ERROR: {str(e)}")
-        output.append(f"\nTraceback:\n{traceback.format_exc()}")
-    
-    return "\n".join(output)
+        yield f"\n❌ ERROR: {str(e)}"
+        yield f"\nTraceback:\n{traceback.format_exc()}"
+
+
+def run_sensitivity_analysis():
+    """Main function to run comprehensive sensitivity analysis"""
+    return "\n".join(iter_sensitivity_analysis())
 
 
 if __name__ == "__main__":
     import sys
     sys.stdout.reconfigure(encoding='utf-8')
-    print(run_sensitivity_analysis())
+    # Stream the report instead of holding it all in memory first
+    for line in iter_sensitivity_analysis():
+        print(line)
@@ -3,199 +3,397 @@ CloudOptima - Simplex Method Solver
 Linear Programming for VM Instance Optimization
 """
 
-import pandas as pd
+import io
 import numpy as np
+from collections import deque
+from scipy.optimize import linprog
 from datetime import datetime
+from data_loader import load_sheet
+
+
+# Report separators and the static tableau header, shared by every section
+_SEP_EQ = "=" * 90
+_SEP_DASH = "-" * 90
+_SEP_DASH70 = "-" * 70
+_SECTION_START = "\n" + _SEP_EQ
+_TABLEAU_HEADER = f"\n{'Basic Var':<15} | {'Value (RHS)':>12} | Status"
+
+
+def _pivot(T, leaving_row, entering_col, work=None):
+    """Pivot tableau T in place on (leaving_row, entering_col)
+    
+    work, if given, is a (pivot_row, multipliers, outer) tuple of scratch
+    arrays shaped for T, so repeated pivots allocate nothing.
+    """
+    if work is None:
+        work = _pivot_workspace(T)
+    pivot_row, multipliers, outer = work
+    
+    # Normalized pivot row computed once, then a single rank-1 update over
+    # all rows; the pivot row itself is overwritten with its normalized copy
+    np.divide(T[leaving_row], T[leaving_row, entering_col], out=pivot_row)
+    multipliers[:] = T[:, entering_col]
+    np.multiply.outer(multipliers, pivot_row, out=outer)
+    T -= outer
+    T[leaving_row] = pivot_row
+
+
+def _pivot_workspace(T):
+    """Scratch arrays for _pivot, allocated once per tableau shape"""
+    rows, cols = T.shape
+    return (np.empty(cols, dtype=T.dtype), np.empty(rows, dtype=T.dtype),
+            np.empty((rows, cols), dtype=T.dtype))
 
 
 class SimplexSolver:
     """Simplex tableau solver with sensitivity analysis"""
     
-    def __init__(self, c, A, b, var_names, constraint_names):
-        self.c = c  # Objective coefficients
-        self.A = A  # Constraint matrix
-        self.b = b  # RHS values
+    def __init__(self, c, A, b, var_names, constraint_names, bland=False, dtype=np.float64,
+                 revised=False):
+        self.c = np.asarray(c, dtype=np.float64)  # Objective coefficients
+        self.A = np.asarray(A, dtype=np.float64)  # Constraint matrix
+        self.b = np.asarray(b, dtype=np.float64)  # RHS values
         self.var_names = var_names
         self.constraint_names = constraint_names
         self.num_vars = len(c)
         self.num_constraints = len(b)
-        self.iterations = []
+        self.bland = bland  # Lowest eligible index enters instead of most negative
+        # float32 halves tableau bandwidth; its pivot tolerance is loosened to match
+        self.dtype = np.dtype(dtype)
+        self.tol = 1e-4 if self.dtype == np.float32 else 1e-6
+        # Revised simplex updates only B^-1 (m x m) per pivot, not the full tableau
+        self.revised = revised
         self.tableau = None
         
+        # Trace of the solve: first 3 and latest 2 entries are kept, each a
+        # message string or a raw (iteration, rhs, basic_cols, entering,
+        # leaving, bland) snapshot formatted only when the trace is read
+        self._trace_head = []
+        self._trace_tail = deque(maxlen=2)
+        self.trace_length = 0
+        
     def initialize_tableau(self):
         """Initialize simplex tableau with slack variables"""
-        self.tableau = []
-        
-        # Add constraint rows with slack variables
-        for i in range(self.num_constraints):
-            row = list(self.A[i])
-            # Add slack variables (identity matrix)
-            for j in range(self.num_constraints):
-                row.append(1 if i == j else 0)
-            row.append(self.b[i])  # RHS
-            self.tableau.append(row)
-        
-        # Add objective row (for maximization: -c)
-        z_row = [-ci for ci in self.c]
-        # Slack variables have 0 coefficient in objective
-        for _ in range(self.num_constraints):
-            z_row.append(0)
-        z_row.append(0)  # Z value starts at 0
-        
-        self.tableau.insert(0, z_row)
-        
-        # Track basic variables
-        self.basic_vars = [f"s{i+1}" for i in range(self.num_constraints)]
-        self.all_vars = self.var_names + [f"s{i+1}" for i in range(self.num_constraints)]
+        n, m = self.num_vars, self.num_constraints
+        
+        # One contiguous (m+1, n+m+1) array filled in place, Z row first
+        T = np.empty((m + 1, n + m + 1), dtype=self.dtype)
+        
+        # Objective row (for maximization: -c); slacks and Z value start at 0
+        T[0, :n] = -self.c
+        T[0, n:] = 0
+        
+        # Constraint rows [A | I | b] with slack variables as the identity block
+        T[1:, :n] = self.A
+        T[1:, n:n + m] = 0
+        np.fill_diagonal(T[1:, n:n + m], 1)
+        T[1:, -1] = self.b
+        self.tableau = T
+        self._work = _pivot_workspace(T)
+        
+        # Basis held as column indices; names are resolved only for display
+        self.basic_col_idx = np.arange(n, n + m, dtype=np.int32)
+        self.is_basic = np.zeros(n + m, dtype=bool)
+        self.is_basic[self.basic_col_idx] = True
+        self.all_vars = self.var_names + [f"s{i+1}" for i in range(m)]
     
-    def get_tableau_string(self, iteration, entering=None, leaving=None):
-        """Format tableau for display"""
+    @property
+    def basic_vars(self):
+        """Names of the basic variables, one per constraint row"""
+        return [self.all_vars[j] for j in self.basic_col_idx.tolist()]
+    
+    def _record(self, entry):
+        """Add an entry to the solve trace"""
+        if len(self._trace_head) < 3:
+            self._trace_head.append(entry)
+        else:
+            self._trace_tail.append(entry)
+        self.trace_length += 1
+    
+    def _snapshot(self, iteration, entering=None, leaving=None, bland=None, rhs=None):
+        """Record the RHS column (of the current tableau by default) and basis"""
+        rhs = self.tableau[:, -1].copy() if rhs is None else rhs
+        self._record((iteration, rhs, self.basic_col_idx.copy(), entering, leaving, bland))
+    
+    @property
+    def iterations(self):
+        """Formatted first 3 and last 2 trace entries (all of them if 5 or fewer)"""
+        return [entry if isinstance(entry, str) else self.get_tableau_string(*entry)
+                for entry in (*self._trace_head, *self._trace_tail)]
+    
+    def get_tableau_string(self, iteration, rhs=None, basic_cols=None, entering=None, leaving=None,
+                           bland=None):
+        """Format tableau for display (the current one unless a snapshot is given)
+        
+        entering and leaving are column indices into all_vars.
+        """
+        if bland is None:
+            bland = self.bland
+        if rhs is None:
+            rhs = self.tableau[:, -1]
+        if basic_cols is None:
+            basic_cols = self.basic_col_idx
+        all_vars = self.all_vars
+        
         lines = []
         
-        lines.append(f"\n{'='*90}")
+        lines.append(_SECTION_START)
         lines.append(f"ITERATION {iteration}")
-        lines.append(f"{'='*90}")
+        lines.append(_SEP_EQ)
         
         if iteration == 0:
             lines.append("Initial Tableau (Standard Form)")
         else:
             lines.append(f"After pivot operation")
         
-        lines.append(f"\n{'Basic Var':<15} | {'Value (RHS)':>12} | Status")
-        lines.append("-" * 90)
+        lines.append(_TABLEAU_HEADER)
+        lines.append(_SEP_DASH)
         
         # Z row
-        z_value = self.tableau[0][-1]
+        z_value = rhs[0]
         lines.append(f"{'Z (Profit)':<15} | ${z_value:>11,.2f} | {'Objective'}")
         
-        # Constraint rows
-        for i in range(1, len(self.tableau)):
-            basic_var = self.basic_vars[i-1]
-            value = self.tableau[i][-1]
-            
-            # Mark entering/leaving
+        # Constraint rows (RHS values formatted in one vectorized call)
+        values = np.char.mod('%12.2f', rhs[1:]).tolist()
+        for basic_col, value in zip(basic_cols.tolist(), values):
+            # Mark entering/leaving (integer column comparisons)
             status = ""
-            if leaving and leaving == basic_var:
+            if basic_col == leaving:
                 status = "← Leaving"
-            elif entering is not None and self.all_vars[entering] == basic_var:
+            elif basic_col == entering:
                 status = "→ Entering"
             
-            lines.append(f"{basic_var:<15} | {value:>12.2f} | {status}")
+            lines.append(f"{all_vars[basic_col]:<15} | {value} | {status}")
         
         if entering is not None:
-            lines.append(f"\n➤ Entering variable: {self.all_vars[entering]}")
-            lines.append(f"   (Most negative coefficient in Z row)")
+            lines.append(f"\n➤ Entering variable: {all_vars[entering]}")
+            lines.append(f"   (First negative coefficient in Z row - Bland's rule)" if bland
+                         else f"   (Most negative coefficient in Z row)")
         
         if leaving is not None:
-            lines.append(f"➤ Leaving variable: {leaving}")
+            lines.append(f"➤ Leaving variable: {all_vars[leaving]}")
             lines.append(f"   (Minimum ratio test)")
         
         return "\n".join(lines)
     
+    def _select_entering(self, reduced, bland):
+        """Entering column for a Z row, or -1 if it is optimal"""
+        neg_mask = reduced < -self.tol
+        
+        if not neg_mask.any():
+            return -1
+        
+        # Most negative coefficient enters (Bland: first negative one)
+        return int(neg_mask.argmax() if bland else reduced.argmin())
+    
+    def _select_leaving(self, rhs, col, bland):
+        """Minimum ratio test: (basis position, ratio), or (-1, inf) if unbounded"""
+        mask = col > self.tol  # Positive values only
+        ratios = np.divide(rhs, col, out=np.full_like(col, np.inf), where=mask)
+        ratios[ratios < 0] = np.inf
+        
+        if np.isinf(ratios).all():
+            return -1, np.inf
+        
+        pos = int(ratios.argmin())
+        min_ratio = ratios[pos]
+        
+        if bland:
+            # Ties on the minimum ratio go to the smallest basic column
+            ties = np.flatnonzero(ratios == min_ratio)
+            pos = int(ties[self.basic_col_idx[ties].argmin()])
+        
+        return pos, min_ratio
+    
+    def _update_basis(self, pos, entering_col):
+        """Put entering_col into the basis at position pos"""
+        self.is_basic[self.basic_col_idx[pos]] = False
+        self.is_basic[entering_col] = True
+        self.basic_col_idx[pos] = entering_col
+    
     def solve(self):
         """Solve using Simplex method"""
+        if self.revised:
+            return self._solve_revised()
+        
         self.initialize_tableau()
         iteration = 0
         
         # Store initial tableau
-        self.iterations.append(self.get_tableau_string(iteration))
+        self._snapshot(iteration)
         
         max_iterations = 50
+        # Dantzig's rule until a degenerate pivot shows up, then Bland's rule
+        # (smallest index entering and leaving) so the method cannot cycle
+        bland = self.bland
         
         while iteration < max_iterations:
-            # Step 1: Check optimality (all coefficients in Z row ≥ 0?)
-            optimal = True
-            entering_col = -1
-            most_negative = 0
-            
-            # Check decision variables only (not slack variables)
-            for j in range(self.num_vars):
-                if self.tableau[0][j] < -1e-6:  # Negative coefficient
-                    optimal = False
-                    if self.tableau[0][j] < most_negative:
-                        most_negative = self.tableau[0][j]
-                        entering_col = j
+            T = self.tableau
             
-            if optimal:
-                self.iterations.append("\n✅ OPTIMAL SOLUTION REACHED!")
-                self.iterations.append("All coefficients in objective row are non-negative.")
-                break
+            # Step 1: Check optimality (all coefficients in Z row ≥ 0?)
+            # Slack columns count too: after a degenerate pivot they can turn
+            # negative, and stopping then leaves a suboptimal vertex
+            entering_col = self._select_entering(T[0, :-1], bland)
             
             if entering_col == -1:
+                self._record("\n✅ OPTIMAL SOLUTION REACHED!")
+                self._record("All coefficients in objective row are non-negative.")
                 break
             
             # Step 2: Minimum ratio test to find leaving variable
-            min_ratio = float('inf')
-            leaving_row = -1
+            pos, min_ratio = self._select_leaving(T[1:, -1], T[1:, entering_col], bland)
             
-            for i in range(1, len(self.tableau)):
-                pivot_col_value = self.tableau[i][entering_col]
-                if pivot_col_value > 1e-6:  # Positive values only
-                    ratio = self.tableau[i][-1] / pivot_col_value
-                    if ratio >= 0 and ratio < min_ratio:
-                        min_ratio = ratio
-                        leaving_row = i
-            
-            if leaving_row == -1:
-                self.iterations.append("\n⚠️ Problem is UNBOUNDED")
+            if pos == -1:
+                self._record("\n⚠️ Problem is UNBOUNDED")
                 return None, "Unbounded", None
             
             iteration += 1
-            leaving_var = self.basic_vars[leaving_row - 1]
+            leaving_col = int(self.basic_col_idx[pos])
             
             # Step 3: Pivot operation
-            pivot_element = self.tableau[leaving_row][entering_col]
+            _pivot(T, pos + 1, entering_col, self._work)
+            self._update_basis(pos, entering_col)
             
-            # Normalize pivot row
-            for j in range(len(self.tableau[leaving_row])):
-                self.tableau[leaving_row][j] /= pivot_element
+            # Store iteration
+            self._snapshot(iteration, entering_col, leaving_col, bland)
             
-            # Eliminate entering variable from other rows
-            for i in range(len(self.tableau)):
-                if i != leaving_row:
-                    multiplier = self.tableau[i][entering_col]
-                    for j in range(len(self.tableau[i])):
-                        self.tableau[i][j] -= multiplier * self.tableau[leaving_row][j]
+            if min_ratio <= self.tol:
+                bland = True
+        
+        if iteration >= max_iterations:
+            self._record("\n⚠️ Maximum iterations reached")
+        
+        return self._extract_solution(iteration)
+    
+    def _solve_revised(self):
+        """Revised simplex: keep only B^-1 and price columns on demand"""
+        self.initialize_tableau()
+        n, m = self.num_vars, self.num_constraints
+        
+        # [A | I] and the objective over all n+m columns; B^-1 starts as I
+        # because the slack basis is the identity
+        M = self.tableau[1:, :-1].copy()
+        cost = np.concatenate([self.c, np.zeros(m, dtype=self.c.dtype)]).astype(self.dtype)
+        B_inv = np.eye(m, dtype=self.dtype)
+        x_B = self.tableau[1:, -1].copy()
+        iteration = 0
+        
+        self._snapshot(iteration)
+        
+        max_iterations = 50
+        refactor_every = 20  # Rebuild B^-1 from scratch to shed rounding drift
+        bland = self.bland
+        
+        while iteration < max_iterations:
+            # Duals, then the Z row of the equivalent tableau (y·M - c)
+            y = cost[self.basic_col_idx] @ B_inv
+            entering_col = self._select_entering(y @ M - cost, bland)
+            
+            if entering_col == -1:
+                self._record("\n✅ OPTIMAL SOLUTION REACHED!")
+                self._record("All coefficients in objective row are non-negative.")
+                break
             
-            # Update basic variables
-            self.basic_vars[leaving_row - 1] = self.all_vars[entering_col]
+            # Entering column expressed in the current basis
+            d = B_inv @ M[:, entering_col]
+            pos, min_ratio = self._select_leaving(x_B, d, bland)
             
-            # Store iteration
-            self.iterations.append(self.get_tableau_string(
-                iteration, entering_col, leaving_var
-            ))
+            if pos == -1:
+                self._record("\n⚠️ Problem is UNBOUNDED")
+                return None, "Unbounded", None
+            
+            iteration += 1
+            leaving_col = int(self.basic_col_idx[pos])
+            
+            # Product-form update of B^-1 and x_B (one elimination step on d)
+            step = x_B[pos] / d[pos]
+            B_inv[pos] /= d[pos]
+            factors = d.copy()
+            factors[pos] = 0
+            B_inv -= np.multiply.outer(factors, B_inv[pos])
+            x_B -= factors * step
+            x_B[pos] = step
+            self._update_basis(pos, entering_col)
+            
+            if iteration % refactor_every == 0:
+                B_inv = np.linalg.inv(M[:, self.basic_col_idx])
+                x_B = B_inv @ self.b
+            
+            z = cost[self.basic_col_idx] @ x_B
+            self._snapshot(iteration, entering_col, leaving_col, bland,
+                           rhs=np.concatenate([[z], x_B]))
+            
+            if min_ratio <= self.tol:
+                bland = True
         
         if iteration >= max_iterations:
-            self.iterations.append("\n⚠️ Maximum iterations reached")
+            self._record("\n⚠️ Maximum iterations reached")
         
-        # Extract solution
-        solution = {var: 0 for var in self.all_vars}
+        # Materialize the final tableau once for reporting and sensitivity
+        T = self.tableau
+        y = cost[self.basic_col_idx] @ B_inv
+        T[0, :-1] = y @ M - cost
+        T[0, -1] = cost[self.basic_col_idx] @ x_B
+        T[1:, :-1] = B_inv @ M
+        T[1:, -1] = x_B
         
-        for i in range(1, len(self.tableau)):
-            var_name = self.basic_vars[i - 1]
-            solution[var_name] = self.tableau[i][-1]
+        return self._extract_solution(iteration)
+    
+    def _extract_solution(self, iteration):
+        """Solution dict, objective value and iteration count from the final tableau"""
+        # Extract solution (dense over all columns, scattered from the basis)
+        n = self.num_vars
+        x = np.zeros(n + self.num_constraints)
+        x[self.basic_col_idx] = self.tableau[1:, -1]
+        solution = dict(zip(self.all_vars, x.tolist()))
+        
+        z_value = self.tableau[0, -1]
         
-        z_value = self.tableau[0][-1]
+        # Duals and primal point read by sensitivity_analysis
+        self.shadow_prices = -self.tableau[0, n:n + self.num_constraints]
+        self.reduced_costs = self.tableau[0, :n]
+        self.x = x[:n]
         
         return solution, z_value, iteration
     
+    def solve_highs(self):
+        """Solve with SciPy's HiGHS dual simplex (no iteration trace)"""
+        self.all_vars = self.var_names + [f"s{i+1}" for i in range(self.num_constraints)]
+        res = linprog(-self.c, A_ub=self.A, b_ub=self.b, bounds=[(0, None)] * self.num_vars,
+                      method='highs-ds')
+        
+        if res.status == 3:
+            return None, "Unbounded", None
+        if not res.success:
+            return None, res.message, None
+        
+        # linprog minimizes -c, so the constraint marginals equal the negated
+        # slack entries of the final Z row and the bound marginals equal its
+        # decision entries - the same values solve() reports
+        self.x = res.x
+        self.shadow_prices = res.ineqlin.marginals
+        self.reduced_costs = res.lower.marginals
+        self.is_basic = np.concatenate([res.x, res.ineqlin.residual]) > 1e-9
+        
+        solution = dict(zip(self.all_vars, np.concatenate([res.x, res.ineqlin.residual]).tolist()))
+        return solution, -res.fun, res.nit
+    
     def sensitivity_analysis(self, solution, z_value):
         """Perform sensitivity analysis on optimal solution"""
         lines = []
         
-        lines.append("\n" + "="*90)
+        lines.append(_SECTION_START)
         lines.append("📊 SENSITIVITY ANALYSIS")
-        lines.append("="*90)
+        lines.append(_SEP_EQ)
         
         # Shadow Prices (dual values from slack variables in final tableau)
         lines.append("\n🔍 SHADOW PRICES (Marginal Value of Resources):")
-        lines.append("-" * 70)
+        lines.append(_SEP_DASH70)
         lines.append(f"{'Constraint':<25} | {'Shadow Price':>15} | {'Interpretation'}")
-        lines.append("-" * 70)
+        lines.append(_SEP_DASH70)
         
         for i in range(self.num_constraints):
-            slack_col = self.num_vars + i
-            shadow_price = -self.tableau[0][slack_col]  # Negative of Z-row coefficient
+            shadow_price = self.shadow_prices[i]  # Negative of Z-row slack coefficient
             
             constraint_name = self.constraint_names[i]
             
@@ -209,129 +407,131 @@ class SimplexSolver:
         
         # Reduced Costs (for non-basic variables)
         lines.append("\n🔍 REDUCED COSTS (Cost to make non-basic variable profitable):")
-        lines.append("-" * 70)
+        lines.append(_SEP_DASH70)
         lines.append(f"{'Variable':<20} | {'Reduced Cost':>15} | {'Status'}")
-        lines.append("-" * 70)
+        lines.append(_SEP_DASH70)
         
         for j in range(self.num_vars):
             var_name = self.var_names[j]
-            reduced_cost = self.tableau[0][j]
+            reduced_cost = self.reduced_costs[j]
             
-            status = "Basic (in solution)" if var_name in self.basic_vars else "Non-basic"
+            status = "Basic (in solution)" if self.is_basic[j] else "Non-basic"
             
             lines.append(f"{var_name:<20} | ${reduced_cost:>14.2f} | {status}")
         
         # Resource Utilization
         lines.append("\n📊 RESOURCE UTILIZATION:")
-        lines.append("-" * 70)
+        lines.append(_SEP_DASH70)
         lines.append(f"{'Resource':<25} | {'Used':>12} | {'Available':>12} | {'Slack':>12} | {'%Used':>8}")
-        lines.append("-" * 70)
+        lines.append(_SEP_DASH70)
         
-        for i in range(self.num_constraints):
-            constraint_name = self.constraint_names[i]
-            available = self.b[i]
-            
-            # Calculate used resources
-            used = 0
-            for j in range(self.num_vars):
-                var_name = self.var_names[j]
-                if var_name in self.basic_vars:
-                    idx = self.basic_vars.index(var_name)
-                    quantity = self.tableau[idx + 1][-1]
-                    used += self.A[i][j] * quantity
-            
-            slack = available - used
-            pct_used = (used / available * 100) if available > 0 else 0
-            
+        # One matrix-vector product gives the usage of every resource; the
+        # loop below only formats
+        used_vec = self.A @ self.x
+        slack_vec = self.b - used_vec
+        pct_vec = np.divide(used_vec, self.b, out=np.zeros_like(used_vec), where=self.b > 0) * 100
+        
+        for constraint_name, used, available, slack, pct_used in zip(
+                self.constraint_names, used_vec.tolist(), self.b.tolist(),
+                slack_vec.tolist(), pct_vec.tolist()):
             lines.append(f"{constraint_name:<25} | {used:>12.1f} | {available:>12.1f} | {slack:>12.1f} | {pct_used:>7.1f}%")
         
         return "\n".join(lines)
 
 
-def run_simplex_method(problem_type="max"):
-    """Main function to run simplex on CloudOptima LP problem"""
-    output = []
+def run_simplex_method(problem_type="max", fast=False):
+    """Main function to run simplex on CloudOptima LP problem
+    
+    With fast=True the LP is handed to HiGHS and the iteration trace is skipped.
+    """
+    buf = io.StringIO()
+    write = buf.write
+    
+    def emit(line):
+        write(line)
+        write("\n")
     
     try:
         # Read Excel data
-        df = pd.read_excel('CloudOptima_OR_Data.xlsx', sheet_name='Linear_Programming')
+        df = load_sheet('Linear_Programming')
         
-        output.append("="*90)
-        output.append("☁️  CLOUDOPTIMA - LINEAR PROGRAMMING OPTIMIZATION")
-        output.append("="*90)
-        output.append(f"\n📅 Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        output.append(f"🎯 Objective: MAXIMIZE Total Hourly Profit")
-        output.append(f"📊 Problem Size: {len(df)} VM types, 10 infrastructure constraints")
+        emit(_SEP_EQ)
+        emit("☁️  CLOUDOPTIMA - LINEAR PROGRAMMING OPTIMIZATION")
+        emit(_SEP_EQ)
+        emit(f"\n📅 Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        emit(f"🎯 Objective: MAXIMIZE Total Hourly Profit")
+        emit(f"📊 Problem Size: {len(df)} VM types, 10 infrastructure constraints")
         
         # Extract data (first 10 rows are VM types)
         vm_data = df.iloc[:10]
         
-        output.append(f"\n📋 VM TYPES:")
+        emit(f"\n📋 VM TYPES:")
         for idx, row in vm_data.iterrows():
-            output.append(f"  • {row['VM_Type']}: ${row['Profit_per_Hour']}/hour (max {int(row['Max_Instances'])} instances)")
+            emit(f"  • {row['VM_Type']}: ${row['Profit_per_Hour']}/hour (max {int(row['Max_Instances'])} instances)")
         
         # Objective coefficients (profit per hour)
-        c = vm_data['Profit_per_Hour'].tolist()
+        c = vm_data['Profit_per_Hour'].to_numpy(dtype=np.float64)
         
         # Variable names
         var_names = vm_data['VM_Type'].tolist()
         
         # Constraint matrix (resource consumption)
         constraint_cols = [col for col in df.columns if col.startswith('Consumes_')]
-        A = vm_data[constraint_cols].values.tolist()
+        A = vm_data[constraint_cols].to_numpy(dtype=np.float64)
         
         # RHS (resource limits from constraint rows)
         constraint_data = df.iloc[12:22]  # Rows after the gap
-        b = constraint_data['Max_Instances'].tolist()
+        b = constraint_data['Max_Instances'].to_numpy(dtype=np.float64)
         
         # Constraint names
         constraint_names = [col.replace('Consumes_', '') for col in constraint_cols]
         
-        output.append(f"\n🔧 CONSTRAINTS (Resource Limits):")
+        emit(f"\n🔧 CONSTRAINTS (Resource Limits):")
         for i, name in enumerate(constraint_names):
-            output.append(f"  {i+1}. {name}: ≤ {b[i]:,.0f}")
+            emit(f"  {i+1}. {name}: ≤ {b[i]:,.0f}")
         
-        output.append(f"\n⏳ Running Simplex Algorithm...")
-        output.append("="*90)
+        emit(f"\n⏳ Running {'HiGHS Dual Simplex' if fast else 'Simplex Algorithm'}...")
+        emit(_SEP_EQ)
         
         # Create and solve
         solver = SimplexSolver(c, A, b, var_names, constraint_names)
-        solution, z_value, iterations = solver.solve()
+        solution, z_value, iterations = solver.solve_highs() if fast else solver.solve()
         
         if solution is None:
-            output.append(f"❌ {z_value}")
-            return "\n".join(output)
+            emit(f"❌ {z_value}")
+            return buf.getvalue()[:-1]
         
         # Show iterations (first 3 and last 2)
-        output.append("\n📈 SIMPLEX ITERATIONS:")
+        if not fast:
+            emit("\n📈 SIMPLEX ITERATIONS:")
         all_iterations = solver.iterations
         
-        if len(all_iterations) <= 5:
+        if solver.trace_length <= 5:
             for iter_text in all_iterations:
-                output.append(iter_text)
+                emit(iter_text)
         else:
             # Show first 3
             for iter_text in all_iterations[:3]:
-                output.append(iter_text)
+                emit(iter_text)
             
-            output.append(f"\n... {len(all_iterations) - 5} intermediate iterations omitted ...")
+            emit(f"\n... {solver.trace_length - 5} intermediate iterations omitted ...")
             
             # Show last 2
             for iter_text in all_iterations[-2:]:
-                output.append(iter_text)
+                emit(iter_text)
         
-        output.append("\n" + "="*90)
-        output.append("🎉 OPTIMAL SOLUTION FOUND!")
-        output.append("="*90)
+        emit(_SECTION_START)
+        emit("🎉 OPTIMAL SOLUTION FOUND!")
+        emit(_SEP_EQ)
         
-        output.append(f"\n💰 MAXIMUM HOURLY PROFIT: ${z_value:,.2f}")
-        output.append(f"🔄 Total Iterations: {iterations}")
+        emit(f"\n💰 MAXIMUM HOURLY PROFIT: ${z_value:,.2f}")
+        emit(f"🔄 Total Iterations: {iterations}")
         
         # Display optimal allocation
-        output.append(f"\n📊 OPTIMAL VM ALLOCATION:")
-        output.append("-" * 70)
-        output.append(f"{'VM Type':<20} | {'Instances':>12} | {'Profit/Hour':>12} | {'Total Profit':>15}")
-        output.append("-" * 70)
+        emit(f"\n📊 OPTIMAL VM ALLOCATION:")
+        emit(_SEP_DASH70)
+        emit(f"{'VM Type':<20} | {'Instances':>12} | {'Profit/Hour':>12} | {'Total Profit':>15}")
+        emit(_SEP_DASH70)
         
         total_instances = 0
         total_profit = 0
@@ -344,24 +544,25 @@ def run_simplex_method(problem_type="max"):
                 total_instances += instances
                 total_profit += vm_profit
                 
-                output.append(f"{vm_name:<20} | {instances:>12.2f} | ${profit_per:>11.2f} | ${vm_profit:>14,.2f}")
+                emit(f"{vm_name:<20} | {instances:>12.2f} | ${profit_per:>11.2f} | ${vm_profit:>14,.2f}")
         
-        output.append("-" * 70)
-        output.append(f"{'TOTAL':<20} | {total_instances:>12.2f} | {'':<12} | ${total_profit:>14,.2f}")
+        emit(_SEP_DASH70)
+        emit(f"{'TOTAL':<20} | {total_instances:>12.2f} | {'':<12} | ${total_profit:>14,.2f}")
         
         # Sensitivity Analysis
         sensitivity_output = solver.sensitivity_analysis(solution, z_value)
-        output.append(sensitivity_output)
+        emit(sensitivity_output)
         
-        output.append(f"\n✅ Analysis Complete!")
-        output.append("="*90)
+        emit(f"\n✅ Analysis Complete!")
+        emit(_SEP_EQ)
         
     except Exception as e:
         import traceback
-        output.append(f"\n❌ ERROR: {str(e)}")
-        output.append(f"\nTraceback:\n{traceback.format_exc()}")
+        emit(f"\n❌ ERROR: {str(e)}")
+        emit(f"\nTraceback:\n{traceback.format_exc()}")
     
-    return "\n".join(output)
+    # Drop the newline written after the last line
+    return buf.getvalue()[:-1]
 
 
 if __name__ == "__main__":
@@ -3,18 +3,208 @@ CloudOptima - Transportation Problem Solver
 VAM, Northwest Corner, Least Cost, and MODI optimization
 """
 
-import pandas as pd
+import io
 import numpy as np
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from scipy.optimize import linprog
+from scipy.sparse import csc_matrix
+from scipy.sparse.linalg import spsolve
 from datetime import datetime
+from data_loader import load_rows
+
+
+def _northwest_corner_allocate(supply, demand, dtype=np.float64):
+    """Northwest corner allocation in closed form ("water-filling")
+    
+    Source i covers the interval (cs[i-1], cs[i]] of the cumulative supply and
+    destination j the interval (cd[j-1], cd[j]] of the cumulative demand; the
+    northwest corner walk ships exactly their overlap.
+    Returns the allocation and an (i, j, amount) log in walk (row-major) order.
+    """
+    cs = np.cumsum(supply, dtype=np.float64)
+    cd = np.cumsum(demand, dtype=np.float64)
+    cs_prev = np.concatenate(([0.0], cs[:-1]))
+    cd_prev = np.concatenate(([0.0], cd[:-1]))
+    
+    overlap = np.minimum(cs[:, None], cd[None, :]) - np.maximum(cs_prev[:, None], cd_prev[None, :])
+    allocation = np.maximum(overlap, 0).astype(dtype)
+    
+    rows, cols = np.nonzero(allocation)
+    log = list(zip(rows.tolist(), cols.tolist(), allocation[rows, cols].tolist()))
+    return allocation, log
+
+
+def _least_cost_allocate(supply, demand, order_i, order_j, dtype=np.float64):
+    """Greedy allocation visiting cells in the given (cheapest-first) order
+    
+    Returns the allocation and an (i, j, amount) log of every allocation made.
+    """
+    allocation = np.zeros((len(supply), len(demand)), dtype=dtype)
+    supply_rem = supply.tolist()
+    demand_rem = demand.tolist()
+    # Open rows/columns, closed exactly when their remainder runs out
+    row_open = [s > 0 for s in supply_rem]
+    col_open = [d > 0 for d in demand_rem]
+    log = []
+    
+    for i, j in zip(order_i.tolist(), order_j.tolist()):
+        if row_open[i] and col_open[j]:
+            amount = min(supply_rem[i], demand_rem[j])
+            allocation[i, j] = amount
+            log.append((i, j, amount))
+            supply_rem[i] -= amount
+            demand_rem[j] -= amount
+            if supply_rem[i] <= 0:
+                row_open[i] = False
+            if demand_rem[j] <= 0:
+                col_open[j] = False
+    
+    return allocation, log
+
+
+@lru_cache(maxsize=32)
+def _prepare(supply, demand, costs, dtype):
+    """Coerce and balance the problem data once per distinct input
+    
+    Takes tuples (so the inputs are hashable) and returns read-only arrays
+    shared by every solver built from the same data, plus the original totals
+    and which dummy ("none", "destination" or "source") was added.
+    """
+    supply = np.array(supply, dtype=dtype)
+    demand = np.array(demand, dtype=dtype)
+    costs = np.array(costs, dtype=dtype)
+    m, n = len(supply), len(demand)
+    supply_sum = supply.sum()
+    demand_sum = demand.sum()
+    
+    if abs(supply_sum - demand_sum) < 1:
+        dummy_type = "none"
+    elif supply_sum > demand_sum:
+        # Final-size arrays filled in place: one copy of the originals each
+        padded = np.empty(n + 1, dtype=dtype)
+        padded[:-1] = demand
+        padded[-1] = supply_sum - demand_sum
+        demand = padded
+        padded_costs = np.zeros((m, n + 1), dtype=dtype)
+        padded_costs[:, :-1] = costs
+        costs = padded_costs
+        dummy_type = "destination"
+    else:
+        padded = np.empty(m + 1, dtype=dtype)
+        padded[:-1] = supply
+        padded[-1] = demand_sum - supply_sum
+        supply = padded
+        padded_costs = np.zeros((m + 1, n), dtype=dtype)
+        padded_costs[:-1] = costs
+        costs = padded_costs
+        dummy_type = "source"
+    
+    for arr in (supply, demand, costs):
+        arr.setflags(write=False)
+    return supply, demand, costs, supply_sum, demand_sum, dummy_type
+
+
+def _spanning_basis(allocation, costs):
+    """Basic cells of an allocation, padded to a spanning tree for MODI
+    
+    Degenerate solutions have fewer than m + n - 1 occupied cells; the
+    cheapest empty cells that do not close a loop are added as epsilon
+    (zero-amount) basic cells. Returns the basis and the added cells.
+    """
+    m, n = allocation.shape
+    # Union-find over row nodes 0..m-1 and column nodes m..m+n-1
+    parent = list(range(m + n))
+    
+    def find(node):
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+    
+    basis = []
+    for i, j in np.argwhere(allocation > 0).tolist():
+        parent[find(i)] = find(m + j)
+        basis.append((i, j))
+    
+    # Stable sort keeps row-major order among equal costs
+    zeros = np.argwhere(allocation == 0)
+    order = np.argsort(costs[zeros[:, 0], zeros[:, 1]], kind='stable')
+    added = []
+    for i, j in zeros[order].tolist():
+        if len(basis) >= m + n - 1:
+            break
+        root_i, root_j = find(i), find(m + j)
+        if root_i != root_j:
+            parent[root_i] = root_j
+            basis.append((i, j))
+            added.append((i, j))
+    
+    return basis, added
+
+
+def _dual_values(basis, costs):
+    """Solve uᵢ + vⱼ = cᵢⱼ over the basic cells with u₁ = 0 (one sparse solve)
+    
+    Returns (u, v), or (None, None) if the basis is not a spanning tree.
+    """
+    m, n = costs.shape
+    if len(basis) != m + n - 1:
+        return None, None
+    
+    bi, bj = np.array(basis).T
+    eq = np.arange(len(basis))
+    A = csc_matrix((np.ones(2 * len(basis)), (np.concatenate([eq, eq]), np.concatenate([bi, m + bj]))),
+                   shape=(len(basis), m + n))
+    # u₁ is fixed at 0, so its column drops out and the system is square
+    uv = np.concatenate(([0.0], np.atleast_1d(spsolve(A[:, 1:], costs[bi, bj].astype(np.float64)))))
+    if not np.all(np.isfinite(uv)):
+        return None, None
+    return uv[:m], uv[m:]
+
+
+def _stepping_stone_loop(basis, m, i, j):
+    """Closed loop formed by the entering cell (i, j) and the basis tree
+    
+    Cells are returned in loop order starting at (i, j): even positions gain
+    the shifted amount, odd positions lose it.
+    """
+    adjacency = {}
+    for r, c in basis:
+        adjacency.setdefault(r, []).append((m + c, (r, c)))
+        adjacency.setdefault(m + c, []).append((r, (r, c)))
+    
+    # Breadth-first search through the tree from row i to column j
+    came_from = {i: None}
+    queue = deque([i])
+    while queue:
+        node = queue.popleft()
+        if node == m + j:
+            break
+        for neighbour, cell in adjacency.get(node, ()):
+            if neighbour not in came_from:
+                came_from[neighbour] = (node, cell)
+                queue.append(neighbour)
+    
+    loop = [(i, j)]
+    node = m + j
+    while came_from[node] is not None:
+        node, cell = came_from[node]
+        loop.append(cell)
+    return loop
 
 
 class TransportationSolver:
     """Complete transportation problem solver"""
     
-    def __init__(self, supply, demand, costs, source_names, dest_names):
-        self.supply = np.array(supply, dtype=float)
-        self.demand = np.array(demand, dtype=float)
-        self.costs = np.array(costs, dtype=float)
+    def __init__(self, supply, demand, costs, source_names, dest_names, dtype=np.float64):
+        # float32 halves the memory traffic of the heuristics' sorts and
+        # masked sweeps; costs are still summed in float64
+        self.dtype = np.dtype(dtype)
+        # Hashable copies of the inputs key the cached preprocessing in _prepare
+        self._data_key = (tuple(np.ravel(supply).tolist()), tuple(np.ravel(demand).tolist()),
+                          tuple(map(tuple, np.asarray(costs).tolist())))
         self.source_names = source_names
         self.dest_names = dest_names
         self.m = len(supply)  # sources
@@ -25,33 +215,24 @@ class TransportationSolver:
     
     def balance_problem(self):
         """Balance supply and demand if needed"""
-        supply_sum = self.supply.sum()
-        demand_sum = self.demand.sum()
+        (self.supply, self.demand, self.costs,
+         supply_sum, demand_sum, self.dummy_type) = _prepare(*self._data_key, self.dtype)
+        self.is_balanced = self.dummy_type == "none"
         
         self.steps.append(f"\n🔍 CHECKING BALANCE:")
         self.steps.append(f"  Total Supply: {supply_sum:,.0f} TB")
         self.steps.append(f"  Total Demand: {demand_sum:,.0f} TB")
         
-        if abs(supply_sum - demand_sum) < 1:
-            self.is_balanced = True
-            self.dummy_type = "none"
+        if self.dummy_type == "none":
             self.steps.append(f"  ✅ Problem is BALANCED")
-        elif supply_sum > demand_sum:
+        elif self.dummy_type == "destination":
             diff = supply_sum - demand_sum
-            self.demand = np.append(self.demand, diff)
-            self.costs = np.hstack([self.costs, np.zeros((self.m, 1))])
             self.dest_names.append("Dummy_Vault")
-            self.dummy_type = "destination"
-            self.is_balanced = False
             self.steps.append(f"  ⚠️  Supply > Demand by {diff:,.0f} TB")
             self.steps.append(f"  ➜ Added dummy destination with 0 cost")
         else:
             diff = demand_sum - supply_sum
-            self.supply = np.append(self.supply, diff)
-            self.costs = np.vstack([self.costs, np.zeros((1, self.n))])
             self.source_names.append("Dummy_DC")
-            self.dummy_type = "source"
-            self.is_balanced = False
             self.steps.append(f"  ⚠️  Demand > Supply by {diff:,.0f} TB")
             self.steps.append(f"  ➜ Added dummy source with 0 cost")
         
@@ -65,29 +246,11 @@ class TransportationSolver:
         steps.append("="*90)
         steps.append("Start from top-left, allocate maximum possible, move right or down")
         
-        allocation = np.zeros((self.m, self.n))
-        supply_rem = self.supply.copy()
-        demand_rem = self.demand.copy()
-        
-        i = j = 0
-        step_num = 1
+        allocation, log = _northwest_corner_allocate(self.supply, self.demand, self.dtype)
         
-        while i < self.m and j < self.n:
-            amount = min(supply_rem[i], demand_rem[j])
-            allocation[i, j] = amount
-            
+        for step_num, (i, j, amount) in enumerate(log, 1):
             steps.append(f"\nStep {step_num}: Allocate {amount:.0f} to ({self.source_names[i]}, {self.dest_names[j]})")
             steps.append(f"  Cost: ${self.costs[i,j]:.2f}/TB × {amount:.0f} TB = ${self.costs[i,j] * amount:,.2f}")
-            
-            supply_rem[i] -= amount
-            demand_rem[j] -= amount
-            
-            if supply_rem[i] == 0:
-                i += 1
-            if demand_rem[j] == 0:
-                j += 1
-            
-            step_num += 1
         
         total_cost = self.calculate_cost(allocation)
         steps.append(f"\n💰 Northwest Corner Total Cost: ${total_cost:,.2f}")
@@ -102,32 +265,16 @@ class TransportationSolver:
         steps.append("="*90)
         steps.append("Always allocate to cell with minimum cost first")
         
-        allocation = np.zeros((self.m, self.n))
-        supply_rem = self.supply.copy()
-        demand_rem = self.demand.copy()
+        # All cells by cost; a stable sort keeps row-major order among ties
+        order_i, order_j = np.unravel_index(np.argsort(self.costs, axis=None, kind='stable'),
+                                            self.costs.shape)
+        allocation, log = _least_cost_allocate(self.supply, self.demand, order_i, order_j,
+                                               self.dtype)
         
-        # Create list of all cells with costs
-        cells = []
-        for i in range(self.m):
-            for j in range(self.n):
-                cells.append((self.costs[i, j], i, j))
-        
-        cells.sort()  # Sort by cost
-        
-        step_num = 1
-        
-        for cost, i, j in cells:
-            if supply_rem[i] > 0 and demand_rem[j] > 0:
-                amount = min(supply_rem[i], demand_rem[j])
-                allocation[i, j] = amount
-                
-                if step_num <= 5:  # Show first 5 steps
-                    steps.append(f"\nStep {step_num}: Allocate {amount:.0f} to ({self.source_names[i]}, {self.dest_names[j]})")
-                    steps.append(f"  Cost: ${cost:.2f}/TB (minimum available)")
-                
-                supply_rem[i] -= amount
-                demand_rem[j] -= amount
-                step_num += 1
+        for step_num, (i, j, amount) in enumerate(log[:5], 1):  # Show first 5 steps
+            steps.append(f"\nStep {step_num}: Allocate {amount:.0f} to ({self.source_names[i]}, {self.dest_names[j]})")
+            steps.append(f"  Cost: ${self.costs[i, j]:.2f}/TB (minimum available)")
+        step_num = len(log) + 1
         
         if step_num > 6:
             steps.append(f"\n... {step_num - 6} more allocations ...")
@@ -145,107 +292,85 @@ class TransportationSolver:
         steps.append("="*90)
         steps.append("Calculate penalties (difference between two smallest costs)")
         
-        allocation = np.zeros((self.m, self.n))
+        allocation = np.zeros((self.m, self.n), dtype=self.dtype)
         supply_rem = self.supply.copy()
         demand_rem = self.demand.copy()
         
-        iteration = 1
+        # Masked cost matrices (unavailable cells = inf) are kept across
+        # iterations and only updated when a row or column runs out; the
+        # penalty partition works in one reusable scratch buffer
+        active_rows = supply_rem > 0
+        active_cols = demand_rem > 0
+        rows_left = int(np.count_nonzero(active_rows))
+        cols_left = int(np.count_nonzero(active_cols))
+        row_costs = np.where(active_cols[None, :], self.costs, np.inf)
+        col_costs = np.where(active_rows[:, None], self.costs, np.inf)
+        scratch = np.empty_like(self.costs)
+        
+        # (i, j, amount, max penalty) per iteration; rendered after the loop
+        log = []
+        stalled = False
         
         while True:
             # Check if done
-            if np.all(supply_rem <= 0) and np.all(demand_rem <= 0):
+            if rows_left == 0 and cols_left == 0:
                 break
             
-            if iteration <= 3:  # Show first 3 iterations
-                steps.append(f"\n--- Iteration {iteration} ---")
+            # Penalties (difference between the two smallest available costs)
+            # for every row and column at once; exhausted lines get -1
+            row_penalties = self._penalties(row_costs, cols_left, 1, scratch)
+            col_penalties = self._penalties(col_costs, rows_left, 0, scratch)
+            row_penalties[~active_rows] = -1
+            col_penalties[~active_cols] = -1
             
-            # Calculate row penalties
-            row_penalties = []
-            for i in range(self.m):
-                if supply_rem[i] <= 0:
-                    row_penalties.append(-1)
-                    continue
-                
-                costs_available = []
-                for j in range(self.n):
-                    if demand_rem[j] > 0:
-                        costs_available.append(self.costs[i, j])
-                
-                if len(costs_available) >= 2:
-                    costs_available.sort()
-                    penalty = costs_available[1] - costs_available[0]
-                elif len(costs_available) == 1:
-                    penalty = costs_available[0]
-                else:
-                    penalty = -1
-                
-                row_penalties.append(penalty)
+            # Find maximum penalty over rows then columns in one argmax
+            # (the first maximum wins, so rows take precedence on ties)
+            penalties = np.concatenate([row_penalties, col_penalties])
+            k = int(penalties.argmax())
+            max_pen = penalties[k]
             
-            # Calculate column penalties
-            col_penalties = []
-            for j in range(self.n):
-                if demand_rem[j] <= 0:
-                    col_penalties.append(-1)
-                    continue
-                
-                costs_available = []
-                for i in range(self.m):
-                    if supply_rem[i] > 0:
-                        costs_available.append(self.costs[i, j])
-                
-                if len(costs_available) >= 2:
-                    costs_available.sort()
-                    penalty = costs_available[1] - costs_available[0]
-                elif len(costs_available) == 1:
-                    penalty = costs_available[0]
-                else:
-                    penalty = -1
-                
-                col_penalties.append(penalty)
-            
-            # Find maximum penalty
-            max_row_pen = max(row_penalties) if row_penalties else -1
-            max_col_pen = max(col_penalties) if col_penalties else -1
-            
-            if max_row_pen < 0 and max_col_pen < 0:
+            if max_pen < 0:
+                stalled = True
                 break
             
-            # Select cell to allocate
-            if max_row_pen >= max_col_pen:
-                i = row_penalties.index(max_row_pen)
-                # Find min cost in this row
-                min_cost = float('inf')
-                j = -1
-                for jj in range(self.n):
-                    if demand_rem[jj] > 0 and self.costs[i, jj] < min_cost:
-                        min_cost = self.costs[i, jj]
-                        j = jj
+            # Select cell to allocate (min available cost in the chosen line)
+            if k < self.m:
+                i = k
+                j = int(row_costs[i].argmin()) if cols_left else -1
             else:
-                j = col_penalties.index(max_col_pen)
-                # Find min cost in this column
-                min_cost = float('inf')
-                i = -1
-                for ii in range(self.m):
-                    if supply_rem[ii] > 0 and self.costs[ii, j] < min_cost:
-                        min_cost = self.costs[ii, j]
-                        i = ii
+                j = k - self.m
+                i = int(col_costs[:, j].argmin()) if rows_left else -1
             
             if i == -1 or j == -1:
+                stalled = True
                 break
             
             # Allocate
             amount = min(supply_rem[i], demand_rem[j])
             allocation[i, j] = amount
-            
-            if iteration <= 3:
-                steps.append(f"  Max penalty: {max(max_row_pen, max_col_pen):.2f}")
-                steps.append(f"  Allocate {amount:.0f} to ({self.source_names[i]}, {self.dest_names[j]})")
-                steps.append(f"  Cost: ${self.costs[i,j]:.2f}/TB")
+            log.append((i, j, amount, max_pen))
             
             supply_rem[i] -= amount
             demand_rem[j] -= amount
-            
-            iteration += 1
+            if supply_rem[i] <= 0:
+                active_rows[i] = False
+                rows_left -= 1
+                col_costs[i, :] = np.inf
+            if demand_rem[j] <= 0:
+                active_cols[j] = False
+                cols_left -= 1
+                row_costs[:, j] = np.inf
+        
+        for iteration, (i, j, amount, max_pen) in enumerate(log[:3], 1):  # Show first 3 iterations
+            steps.append(f"\n--- Iteration {iteration} ---")
+            steps.append(f"  Max penalty: {max_pen:.2f}")
+            steps.append(f"  Allocate {amount:.0f} to ({self.source_names[i]}, {self.dest_names[j]})")
+            steps.append(f"  Cost: ${self.costs[i,j]:.2f}/TB")
+        iteration = len(log) + 1
+        
+        # An iteration that found nothing to allocate still shows its header
+        if stalled and iteration <= 3:
+            steps.append(f"\n--- Iteration {iteration} ---")
         
         if iteration > 4:
             steps.append(f"\n... {iteration - 4} more iterations ...")
@@ -255,120 +380,217 @@ class TransportationSolver:
         
         return allocation, total_cost, "\n".join(steps)
     
+    @staticmethod
+    def _penalties(masked_costs, available, axis, scratch):
+        """VAM penalty per line of a cost matrix whose unavailable cells are inf
+        
+        scratch is a same-shape buffer the partition runs in, so no m×n
+        temporary is allocated per call.
+        """
+        if available >= 2:
+            two_smallest = scratch
+            np.copyto(two_smallest, masked_costs)
+            two_smallest.partition(1, axis=axis)
+            lowest = two_smallest.take(0, axis=axis)
+            return two_smallest.take(1, axis=axis) - lowest
+        if available == 1:
+            return masked_costs.min(axis=axis)
+        return np.full(masked_costs.shape[1 - axis], -1.0)
+    
     def modi_method(self, initial_allocation):
-        """MODI method for optimality test (simplified)"""
+        """MODI (u-v) method: optimality test and stepping-stone improvement"""
         steps = []
         steps.append("\n" + "="*90)
         steps.append("📊 MODI METHOD - OPTIMALITY TEST")
         steps.append("="*90)
         
-        allocation = initial_allocation.copy()
+        allocation = np.array(initial_allocation, dtype=self.dtype)
         
         # Check degeneracy
-        basic_cells = np.sum(allocation > 0)
+        # Allocations are never negative, so nonzero cells are the basic cells
+        basic_cells = int(np.count_nonzero(allocation))
         required = self.m + self.n - 1
         
         steps.append(f"\n🔍 Degeneracy Check:")
         steps.append(f"  Basic cells required: {required}")
         steps.append(f"  Basic cells found: {basic_cells}")
         
+        # Epsilon cells join the basis with a zero amount
+        basis, added = _spanning_basis(allocation, self.costs)
+        
         if basic_cells < required:
             steps.append(f"  ⚠️  Degenerate solution (short by {required - basic_cells})")
             steps.append(f"  Adding epsilon to minimum cost zero cells...")
-            
-            # Add epsilon to some zero cells
-            added = 0
-            for i in range(self.m):
-                for j in range(self.n):
-                    if allocation[i, j] == 0 and added < (required - basic_cells):
-                        allocation[i, j] = 1e-10
-                        added += 1
-                        if added >= (required - basic_cells):
-                            break
-                if added >= (required - basic_cells):
-                    break
-            
-            steps.append(f"  ✓ Added {added} epsilon values")
+            steps.append(f"  ✓ Added {len(added)} epsilon values")
         else:
             steps.append(f"  ✓ Non-degenerate solution")
         
-        # Calculate u and v values (simplified - showing concept)
         steps.append(f"\n📈 Calculating u and v values (dual variables):")
         steps.append(f"  Using constraint: uᵢ + vⱼ = cᵢⱼ for basic cells")
         steps.append(f"  Setting u₁ = 0 as reference")
+        steps.append(f"  Opportunity cost of an empty cell: uᵢ + vⱼ - cᵢⱼ")
+        
+        # (i, j, opportunity cost, amount shifted, loop length, cost after)
+        log = []
+        optimal = False
+        u = v = None
+        
+        for _ in range(10 * self.m * self.n):
+            u, v = _dual_values(basis, self.costs)
+            if u is None:
+                break
+            
+            opportunity = u[:, None] + v[None, :] - self.costs
+            bi, bj = np.array(basis).T
+            opportunity[bi, bj] = 0
+            k = int(opportunity.argmax())
+            max_opp = opportunity.flat[k]
+            
+            if max_opp <= 1e-9:
+                optimal = True
+                break
+            
+            # Shift the largest amount the stepping-stone loop allows
+            i, j = divmod(k, self.n)
+            loop = _stepping_stone_loop(basis, self.m, i, j)
+            losing = loop[1::2]
+            amounts = [allocation[cell] for cell in losing]
+            leaving = int(np.argmin(amounts))
+            theta = amounts[leaving]
+            for cell in loop[0::2]:
+                allocation[cell] += theta
+            for cell in losing:
+                allocation[cell] -= theta
+            basis[basis.index(losing[leaving])] = (i, j)
+            
+            log.append((i, j, max_opp, theta, len(loop), self.calculate_cost(allocation)))
+        
+        for iteration, (i, j, max_opp, theta, loop_len, cost) in enumerate(log[:3], 1):  # Show first 3 iterations
+            steps.append(f"\n--- Iteration {iteration} ---")
+            steps.append(f"  Max opportunity cost: {max_opp:.2f} at ({self.source_names[i]}, {self.dest_names[j]})")
+            steps.append(f"  Stepping-stone loop of {loop_len} cells, shift {theta:.0f} TB")
+            steps.append(f"  Cost: ${cost:,.2f}")
+        if len(log) > 3:
+            steps.append(f"\n... {len(log) - 3} more iterations ...")
         
-        # For demonstration purposes
-        steps.append(f"\n  (Full MODI calculation would iterate here)")
-        steps.append(f"  All opportunity costs ≤ 0 indicates optimality")
+        if u is not None:
+            steps.append(f"\n  u: " + ", ".join(f"{x:.2f}" for x in u.tolist()))
+            steps.append(f"  v: " + ", ".join(f"{x:.2f}" for x in v.tolist()))
         
         final_cost = self.calculate_cost(allocation)
-        steps.append(f"\n✅ Solution verified as optimal")
+        if optimal:
+            if not log:
+                steps.append(f"\n  ✓ No empty cell has a positive opportunity cost")
+            steps.append(f"  All opportunity costs ≤ 0 indicates optimality")
+            steps.append(f"\n✅ Solution verified as optimal after {len(log)} MODI iterations")
+        elif u is None:
+            steps.append(f"\n⚠️  Basis is not a spanning tree - MODI stopped")
+        else:
+            steps.append(f"\n⚠️  MODI stopped after {len(log)} iterations without proving optimality")
         steps.append(f"💰 Final Cost: ${final_cost:,.2f}")
         
         return allocation, final_cost, "\n".join(steps)
     
+    def solve_exact(self):
+        """Exact optimum of the balanced problem as a linear program (HiGHS)"""
+        m, n = self.m, self.n
+        # Variable i*n + j is the amount shipped from source i to destination j
+        A_supply = np.kron(np.eye(m), np.ones((1, n)))
+        A_demand = np.kron(np.ones((1, m)), np.eye(n))
+        
+        # HiGHS works in float64, so the side comparison must too (float32
+        # totals can disagree with it and make the LP infeasible)
+        supply = self.supply.astype(np.float64)
+        demand = self.demand.astype(np.float64)
+        
+        # "Balanced" allows a sub-unit mismatch, so the larger side is an upper
+        # bound rather than an equality to keep the LP feasible
+        if supply.sum() >= demand.sum():
+            res = linprog(self.costs.ravel(), A_ub=A_supply, b_ub=supply,
+                          A_eq=A_demand, b_eq=demand, bounds=(0, None), method='highs')
+        else:
+            res = linprog(self.costs.ravel(), A_ub=A_demand, b_ub=demand,
+                          A_eq=A_supply, b_eq=supply, bounds=(0, None), method='highs')
+        
+        if not res.success:
+            return None, None
+        
+        allocation = res.x.reshape(m, n)
+        allocation = np.where(allocation > 1e-9, allocation, 0).astype(self.dtype)
+        return allocation, self.calculate_cost(allocation)
+    
     def calculate_cost(self, allocation):
         """Calculate total transportation cost"""
-        return np.sum(allocation * self.costs)
+        # Fused multiply-and-reduce: no m×n temporary, float64 accumulation
+        return float(np.einsum('ij,ij->', allocation, self.costs, dtype=np.float64))
     
     def format_allocation_table(self, allocation, cost):
         """Format allocation as table"""
-        lines = []
+        buf = io.StringIO()
+        write = buf.write
+        
+        def emit(line):
+            write(line)
+            write("\n")
         
-        lines.append(f"\n📊 ALLOCATION TABLE (Units in TB):")
-        lines.append("-" * 90)
+        emit(f"\n📊 ALLOCATION TABLE (Units in TB):")
+        emit("-" * 90)
         
         # Header
-        header = f"{'Source':<15}"
-        for dest in self.dest_names:
-            header += f"{dest:>12}"
-        header += f"{'Supply':>12}"
-        lines.append(header)
-        lines.append("-" * 90)
-        
-        # Rows
-        for i in range(self.m):
-            row = f"{self.source_names[i]:<15}"
-            for j in range(self.n):
-                if allocation[i, j] > 0:
-                    row += f"{allocation[i,j]:>12.0f}"
-                else:
-                    row += f"{'-':>12}"
-            row += f"{self.supply[i]:>12.0f}"
-            lines.append(row)
+        header = (f"{'Source':<15}" + "".join(f"{dest:>12}" for dest in self.dest_names)
+                  + f"{'Supply':>12}")
+        emit(header)
+        emit("-" * 90)
+        
+        # Rows (all cells formatted in one vectorized pass, empty cells as '-')
+        cells = np.where(allocation > 0, np.char.mod('%12.0f', allocation), f"{'-':>12}")
+        supply_cells = np.char.mod('%12.0f', self.supply)
+        for name, row, supply_cell in zip(self.source_names, cells.tolist(), supply_cells.tolist()):
+            emit(f"{name:<15}" + "".join(row) + supply_cell)
         
         # Demand row
-        demand_row = f"{'Demand':<15}"
-        for j in range(self.n):
-            demand_row += f"{self.demand[j]:>12.0f}"
-        lines.append("-" * 90)
-        lines.append(demand_row)
+        demand_row = f"{'Demand':<15}" + "".join(np.char.mod('%12.0f', self.demand).tolist())
+        emit("-" * 90)
+        emit(demand_row)
         
-        lines.append(f"\n💰 Total Cost: ${cost:,.2f}")
+        emit(f"\n💰 Total Cost: ${cost:,.2f}")
         
-        return "\n".join(lines)
+        # Drop the newline written after the last line
+        return buf.getvalue()[:-1]
     
     def solve_all_methods(self):
         """Solve using all methods and compare"""
-        output = []
-        
-        # Add balance check
-        output.append("\n".join(self.steps))
+        buf = io.StringIO()
+        write = buf.write
         
-        # Method 1: Northwest Corner
-        nw_alloc, nw_cost, nw_steps = self.northwest_corner()
-        output.append(nw_steps)
-        output.append(self.format_allocation_table(nw_alloc, nw_cost))
+        def emit(line):
+            write(line)
+            write("\n")
         
-        # Method 2: Least Cost
-        lc_alloc, lc_cost, lc_steps = self.least_cost()
-        output.append(lc_steps)
-        output.append(self.format_allocation_table(lc_alloc, lc_cost))
-        
-        # Method 3: VAM
-        vam_alloc, vam_cost, vam_steps = self.vogels_approximation()
-        output.append(vam_steps)
-        output.append(self.format_allocation_table(vam_alloc, vam_cost))
+        # Add balance check
+        emit("\n".join(self.steps))
+        
+        # The three heuristics only read the problem data, so they run
+        # concurrently; results are reported in the usual order
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            nw_future = pool.submit(self.northwest_corner)
+            lc_future = pool.submit(self.least_cost)
+            vam_future = pool.submit(self.vogels_approximation)
+            
+            # Method 1: Northwest Corner
+            nw_alloc, nw_cost, nw_steps = nw_future.result()
+            emit(nw_steps)
+            emit(self.format_allocation_table(nw_alloc, nw_cost))
+            
+            # Method 2: Least Cost
+            lc_alloc, lc_cost, lc_steps = lc_future.result()
+            emit(lc_steps)
+            emit(self.format_allocation_table(lc_alloc, lc_cost))
+            
+            # Method 3: VAM
+            vam_alloc, vam_cost, vam_steps = vam_future.result()
+            emit(vam_steps)
+            emit(self.format_allocation_table(vam_alloc, vam_cost))
         
         # Find best method
         methods = {
@@ -377,124 +599,157 @@ class TransportationSolver:
             "Vogel's (VAM)": (vam_alloc, vam_cost)
         }
         
-        best_method = min(methods.items(), key=lambda x: x[1][1])
+        # Compared at the cent precision shown in the report, so methods that
+        # tie there resolve to the first one listed
+        best_method = min(methods.items(), key=lambda x: round(x[1][1], 2))
         best_alloc, best_cost = best_method[1]
         
         # Apply MODI to best solution
-        output.append(f"\n🏆 BEST INITIAL SOLUTION: {best_method[0]} (${best_cost:,.2f})")
+        emit(f"\n🏆 BEST INITIAL SOLUTION: {best_method[0]} (${best_cost:,.2f})")
         
         optimal_alloc, optimal_cost, modi_steps = self.modi_method(best_alloc)
-        output.append(modi_steps)
+        modi_cost = optimal_cost
+        emit(modi_steps)
+        
+        # The exact LP optimum is authoritative; the heuristics are kept to
+        # show how each method gets there
+        emit("\n" + "="*90)
+        emit("🧮 EXACT OPTIMUM - LINEAR PROGRAM (HiGHS)")
+        emit("="*90)
+        
+        exact_alloc, exact_cost = self.solve_exact()
+        if exact_alloc is not None:
+            emit("All routes solved together as one LP - this solution is authoritative")
+            emit(self.format_allocation_table(exact_alloc, exact_cost))
+            if abs(exact_cost - modi_cost) <= 0.01:
+                emit("✓ Matches the MODI optimum")
+            else:
+                emit(f"⚠️  MODI ended at ${modi_cost:,.2f}")
+            optimal_alloc, optimal_cost = exact_alloc, exact_cost
+        else:
+            emit("⚠️  LP solver failed - reporting the MODI result instead")
         
         # Final comparison
-        output.append("\n" + "="*90)
-        output.append("📊 COST COMPARISON")
-        output.append("="*90)
-        output.append(f"\n{'Method':<30} {'Cost':>20}")
-        output.append("-" * 52)
+        emit("\n" + "="*90)
+        emit("📊 COST COMPARISON")
+        emit("="*90)
+        emit(f"\n{'Method':<30} {'Cost':>20}")
+        emit("-" * 52)
         
         for method, (_, cost) in methods.items():
-            output.append(f"{method:<30} ${cost:>19,.2f}")
+            emit(f"{method:<30} ${cost:>19,.2f}")
         
-        output.append(f"{'Optimal (after MODI)':<30} ${optimal_cost:>19,.2f}")
-        output.append("-" * 52)
+        if exact_alloc is not None:
+            emit(f"{'After MODI':<30} ${modi_cost:>19,.2f}")
+            emit(f"{'Optimal (exact LP)':<30} ${optimal_cost:>19,.2f}")
+        else:
+            emit(f"{'Optimal (after MODI)':<30} ${optimal_cost:>19,.2f}")
+        emit("-" * 52)
         
         improvement = best_cost - optimal_cost
         if improvement > 0.01:
-            output.append(f"\n📈 Improvement: ${improvement:,.2f} ({improvement/best_cost*100:.1f}%)")
+            emit(f"\n📈 Improvement: ${improvement:,.2f} ({improvement/best_cost*100:.1f}%)")
         else:
-            output.append(f"\n✓ Initial solution was already optimal")
+            emit(f"\n✓ Initial solution was already optimal")
         
-        return "\n".join(output), methods, optimal_alloc, optimal_cost
+        # Drop the newline written after the last line
+        return buf.getvalue()[:-1], methods, optimal_alloc, optimal_cost
 
 
 def run_transportation_problem():
     """Main function to solve CloudOptima transportation problem"""
-    output = []
+    buf = io.StringIO()
+    write = buf.write
+    
+    def emit(line):
+        write(line)
+        write("\n")
     
     try:
         # Read data
-        df = pd.read_excel('CloudOptima_OR_Data.xlsx', 
-                          sheet_name='Transportation_Problem',
-                          index_col=0)
+        header, *rows = load_rows('Transportation_Problem')
+        labels = [row[0] for row in rows]
+        columns = list(header[1:])
         
-        output.append("="*90)
-        output.append("☁️  CLOUDOPTIMA - TRANSPORTATION PROBLEM")
-        output.append("="*90)
-        output.append(f"\n📅 Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        output.append(f"🎯 Objective: MINIMIZE data transfer costs")
-        output.append(f"📊 Problem: Route data from 10 Data Centers to 10 Storage Vaults")
+        emit("="*90)
+        emit("☁️  CLOUDOPTIMA - TRANSPORTATION PROBLEM")
+        emit("="*90)
+        emit(f"\n📅 Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        emit(f"🎯 Objective: MINIMIZE data transfer costs")
+        emit(f"📊 Problem: Route data from 10 Data Centers to 10 Storage Vaults")
         
         # Extract data (first 10 rows are sources, last row might be demand)
-        sources = df.index[:10].tolist()
+        sources = labels[:10]
         
-        # Check if 'Supply_TB' column exists
-        if 'Supply_TB' in df.columns:
-            supply = df['Supply_TB'][:10].values
-            cost_cols = [col for col in df.columns if col != 'Supply_TB']
-            costs = df[cost_cols][:10].values
+        # Supply is the 'Supply_TB' column, or the last column if it is missing
+        if 'Supply_TB' in columns:
+            supply_col = columns.index('Supply_TB')
         else:
-            # Fallback if structure is different
-            supply = df.iloc[:10, -1].values
-            costs = df.iloc[:10, :-1].values
-            cost_cols = df.columns[:-1].tolist()
+            supply_col = len(columns) - 1
+        cost_idx = [k for k in range(len(columns)) if k != supply_col]
+        cost_cols = [columns[k] for k in cost_idx]
+        
+        table = np.array([row[1:] for row in rows[:10]], dtype=float)
+        supply = table[:, supply_col]
+        costs = table[:, cost_idx]
         
         destinations = cost_cols
         
         # Get demand (from last row or generate balanced)
-        if 'Demand_TB' in df.index:
-            demand = df.loc['Demand_TB', cost_cols].values
+        if 'Demand_TB' in labels:
+            demand_row = rows[labels.index('Demand_TB')]
+            demand = np.array([demand_row[1 + k] for k in cost_idx], dtype=float)
         else:
-            # Generate balanced demand
-            demand = supply.copy()
-            np.random.shuffle(demand)
+            # Generate balanced demand (seeded, so repeated runs report the same data)
+            demand = np.random.default_rng(0).permutation(supply)
         
-        output.append(f"\n📍 DATA CENTERS (Sources):")
+        emit(f"\n📍 DATA CENTERS (Sources):")
         for i, source in enumerate(sources, 1):
-            output.append(f"  {i}. {source}: {supply[i-1]:,.0f} TB available")
+            emit(f"  {i}. {source}: {supply[i-1]:,.0f} TB available")
         
-        output.append(f"\n🗄️  STORAGE VAULTS (Destinations):")
+        emit(f"\n🗄️  STORAGE VAULTS (Destinations):")
         for i, dest in enumerate(destinations, 1):
-            output.append(f"  {i}. {dest}: {demand[i-1]:,.0f} TB capacity")
+            emit(f"  {i}. {dest}: {demand[i-1]:,.0f} TB capacity")
         
-        output.append(f"\n💰 COST MATRIX ($ per TB transfer):")
-        output.append("-" * 90)
+        emit(f"\n💰 COST MATRIX ($ per TB transfer):")
+        emit("-" * 90)
         
         # Display cost matrix (first 5x5 for brevity)
         header = f"{'Source':<15}" + "".join(f"{dest:>10}" for dest in destinations[:5]) + " ..."
-        output.append(header)
-        output.append("-" * 90)
+        emit(header)
+        emit("-" * 90)
         
         for i in range(min(5, len(sources))):
             row = f"{sources[i]:<15}"
             for j in range(min(5, len(destinations))):
                 row += f"${costs[i,j]:>9.2f}"
             row += " ..."
-            output.append(row)
+            emit(row)
         
         if len(sources) > 5:
-            output.append("  ...")
+            emit("  ...")
         
-        output.append("-" * 90)
+        emit("-" * 90)
         
         # Solve
-        output.append(f"\n⏳ Solving using multiple methods...")
+        emit(f"\n⏳ Solving using multiple methods...")
         
         solver = TransportationSolver(supply, demand, costs, sources, destinations)
         results, methods, optimal_alloc, optimal_cost = solver.solve_all_methods()
         
-        output.append(results)
+        emit(results)
         
         # Summary
-        output.append(f"\n✅ Transportation Problem Solved Successfully!")
-        output.append("="*90)
+        emit(f"\n✅ Transportation Problem Solved Successfully!")
+        emit("="*90)
         
     except Exception as e:
         import traceback
-        output.append(f"\n❌ ERROR: {str(e)}")
-        output.append(f"\nTraceback:\n{traceback.format_exc()}")
+        emit(f"\n❌ ERROR: {str(e)}")
+        emit(f"\nTraceback:\n{traceback.format_exc()}")
     
-    return "\n".join(output)
+    # Drop the newline written after the last line
+    return buf.getvalue()[:-1]
 
 
 if __name__ == "__main__":